@@ -4,13 +4,120 @@ Application Data Generator
 Creates realistic application installation info and data
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property
 import hashlib
+import os
 import random
 from pathlib import Path
 
 from config import INSTALLED_APPLICATIONS, USER_NAME, USER_EMAIL
-from utils.helpers import ensure_directory, file_size_string, write_binary_file
+from utils.helpers import ensure_directory, file_size_string, random_ints
+
+# Stub binaries are written in chunks of this size to keep peak memory flat
+STUB_CHUNK_SIZE = 64 * 1024
+
+# User-space buffer for text files so each one goes out in a single write
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Per-app stanzas, filled from the pre-formatted strings in app_metadata
+APP_LIST_ENTRY_TEMPLATE = (
+    "\n{index}. {name}\n"
+    "   Version: {version}\n"
+    "   Installed: {install_date_mdy}\n"
+    "   Size: {size_str}\n"
+    "   Last Used: {last_used_mdy}\n"
+)
+
+USAGE_HISTORY_ENTRY_TEMPLATE = (
+    "{name}\n"
+    "  Sessions: {sessions}\n"
+    "  Avg Session Length: {avg_minutes} minutes\n"
+    "  Last Used: {last_used_ymdhms}\n"
+    "  Launch Method: Start Menu / Taskbar\n"
+    + "-" * 70
+)
+
+INSTALL_LOG_TEMPLATE = (
+    "{name} installation log\n"
+    "Version: {version}\n"
+    "Installed: {install_date_ymdhms}\n"
+    "Last Launched: {last_used_ymdhms}\n"
+    "Status: Completed successfully\n"
+)
+
+CONFIG_INI_TEMPLATE = (
+    "[General]\n"
+    "install_path={install_dir}\n"
+    "user={user}\n"
+    "auto_update=true\n"
+    "last_update_check={update_check}\n"
+)
+
+USAGE_LOG_TEMPLATE = (
+    "App: {name}\n"
+    "Sessions this month: {sessions}\n"
+    "Last used: {last_used_ymdhms}\n"
+    "Recent files opened: cache.db; settings.json; preferences.xml\n"
+)
+
+
+# Static download history rows: (filename, description, size_mb, source)
+DOWNLOADS = [
+    ("ChromeSetup.exe", "Google Chrome installer", 1.3, "Chrome"),
+    ("FirefoxInstaller.exe", "Firefox installer", 54.2, "Firefox"),
+    ("MicrosoftEdgeSetup.exe", "Edge installer", 2.1, "Edge"),
+    ("vlc-3.0.20-win64.exe", "VLC installer", 40.5, "Chrome"),
+    ("ZoomInstallerFull.msi", "Zoom client", 67.2, "Edge"),
+    ("winrar-x64-701.exe", "WinRAR archive utility", 3.4, "Firefox"),
+    ("7z2408-x64.exe", "7-Zip archive utility", 1.7, "Chrome"),
+    ("Docker_Desktop_Installer.exe", "Docker Desktop", 512.0, "Chrome"),
+    ("Git-2.42.0-64-bit.exe", "Git for Windows", 48.5, "Edge"),
+    ("NotepadPlusPlus-8.6.2-x64.exe", "Notepad++", 4.5, "Firefox"),
+    ("BoxDrive.msi", "Box Drive client", 34.4, "Chrome"),
+    ("SlackSetup.exe", "Slack desktop", 93.7, "Chrome"),
+    ("spotify_installer.exe", "Spotify", 1.1, "Edge"),
+    ("AdobeReader_DC_Installer.exe", "Adobe Acrobat Reader", 201.2, "Firefox"),
+    ("project_budget.xlsx", "Q4 budget spreadsheet", 0.9, "Chrome"),
+    ("client_contract.docx", "Client contract draft", 0.4, "Edge"),
+    ("tax_returns_2024.zip", "Tax returns bundle", 12.8, "Chrome"),
+    ("logs_archive_2024-01-05.7z", "System logs", 6.1, "Firefox"),
+    ("meeting_notes.txt", "Team sync notes", 0.02, "Edge"),
+    ("design_assets_v3.rar", "Design assets", 48.2, "Chrome"),
+    ("invoice_2024-11-15.pdf", "Vendor invoice", 0.3, "Edge"),
+    ("aws_architecture_diagram.png", "Architecture diagram", 0.8, "Firefox"),
+]
+
+# Size strings never change, so format them once at import
+_DOWNLOADS_PREFORMATTED = [
+    (filename, description, file_size_string(int(size_mb * 1024 * 1024)), source)
+    for filename, description, size_mb, source in DOWNLOADS
+]
+
+
+# Real-world installer filenames; other apps fall back to <safe_name>_Setup.exe
+INSTALLER_FILENAMES = {
+    "Google Chrome": "ChromeSetup.exe",
+    "Mozilla Firefox": "FirefoxInstaller.exe",
+    "Microsoft Edge": "MicrosoftEdgeSetup.exe",
+    "Microsoft Teams": "TeamsSetup.exe",
+    "Zoom": "ZoomInstallerFull.msi",
+    "VLC Media Player": "vlc-3.0.20-win64.exe",
+    "WinRAR": "winrar-x64-701.exe",
+    "7-Zip": "7z2408-x64.exe",
+    "Visual Studio Code": "VSCodeUserSetup-x64-1.84.2.exe",
+    "Docker Desktop": "Docker Desktop Installer.exe",
+    "Git": "Git-2.42.0-64-bit.exe",
+    "Google Drive": "GoogleDriveFSSetup.exe",
+    "Dropbox": "DropboxInstaller.exe",
+    "Microsoft OneDrive": "OneDriveSetup.exe",
+    "Box": "BoxDrive.msi",
+    "Spotify": "spotify_installer.exe",
+    "Slack": "SlackSetup.exe",
+    "Notepad++": "NotepadPlusPlus-8.6.2-x64.exe",
+    "Adobe Acrobat Reader DC": "AdobeReader_DC_Installer.exe",
+}
 
 
 class ApplicationDataGenerator:
@@ -19,7 +126,11 @@ class ApplicationDataGenerator:
     def __init__(self, base_path, paths=None):
         self.base_path = Path(base_path)
         self.paths = paths or {}
-        self.app_metadata = self._build_app_metadata()
+
+    @cached_property
+    def app_metadata(self):
+        """Per-app metadata, built on first access so unrelated callers skip it"""
+        return self._build_app_metadata()
 
     def _build_app_metadata(self):
         """
@@ -27,32 +138,73 @@ class ApplicationDataGenerator:
         manifests share the same install dates and versions.
         """
         metadata = {}
-        for app in INSTALLED_APPLICATIONS:
-            install_date = datetime.now() - timedelta(days=random.randint(30, 1000))
-            version = f"{random.randint(1, 20)}.{random.randint(0, 9)}.{random.randint(0, 99)}"
-            size_mb = random.randint(50, 2000)
-            last_used = datetime.now() - timedelta(days=random.randint(0, 30))
+        now = datetime.now()
+        count = len(INSTALLED_APPLICATIONS)
+        # One batched draw per field instead of several randint calls per app
+        fields = zip(
+            INSTALLED_APPLICATIONS,
+            random_ints(30, 1000, count),
+            random_ints(1, 20, count),
+            random_ints(0, 9, count),
+            random_ints(0, 99, count),
+            random_ints(50, 2000, count),
+            random_ints(0, 30, count),
+        )
+        for app, install_days, major, minor, patch, size_mb, last_used_days in fields:
+            install_date = now - timedelta(days=install_days)
+            version = f"{major}.{minor}.{patch}"
+            last_used = now - timedelta(days=last_used_days)
             metadata[app] = {
+                "name": app,
                 "install_date": install_date,
                 "version": version,
                 "size_mb": size_mb,
                 "last_used": last_used,
+                # Pre-formatted once here; every report below reuses these strings
+                "install_date_mdy": install_date.strftime('%m/%d/%Y'),
+                "install_date_ymd": install_date.strftime('%Y-%m-%d'),
+                "install_date_ymdhms": install_date.strftime('%Y-%m-%d %H:%M:%S'),
+                "last_used_mdy": last_used.strftime('%m/%d/%Y'),
+                "last_used_ymdhms": last_used.strftime('%Y-%m-%d %H:%M:%S'),
+                "size_str": file_size_string(size_mb * 1024 * 1024),
+                "safe_name": app.replace(" ", "_"),
             }
         return metadata
 
-    def _make_stub_binary(self, path: Path, size_kb: int = 256):
+    def _stub_seeds(self, count):
+        """
+        Draw one filler seed per stub from the shared random stream, so stubs
+        written on worker threads stay reproducible under a seeded run.
+        """
+        return [random.getrandbits(64) for _ in range(count)]
+
+    def _make_stub_binary(self, path: Path, size_kb: int = 256, seed=None):
         """
         Create a small placeholder binary so executables exist on disk.
+        Fresh random bytes are drawn per chunk and written straight out,
+        keeping memory flat while every file's content stays unique.
+        Returns the SHA-256 hex digest, computed while writing.
         """
+        if seed is None:
+            seed = self._stub_seeds(1)[0]
+        rng = random.Random(seed)
         size_bytes = max(size_kb, 32) * 1024
         header = b"MZ"  # Windows binary header magic
-        padding = random.randbytes(size_bytes - len(header))
-        return write_binary_file(path, header + padding)
+        digest = hashlib.sha256(header)
+        with open(path, "wb") as handle:
+            handle.write(header)
+            remaining = size_bytes - len(header)
+            while remaining > 0:
+                chunk = rng.randbytes(min(remaining, STUB_CHUNK_SIZE))
+                handle.write(chunk)
+                digest.update(chunk)
+                remaining -= len(chunk)
+        return digest.hexdigest()
     
     def generate_installed_apps_list(self):
         """Generate list of installed applications"""
         
-        content = f"""INSTALLED APPLICATIONS
+        parts = [f"""INSTALLED APPLICATIONS
 Computer: {USER_NAME}'s Workstation
 Last Updated: {datetime.now().strftime('%B %d, %Y %H:%M:%S')}
 
@@ -60,17 +212,12 @@ Last Updated: {datetime.now().strftime('%B %d, %Y %H:%M:%S')}
 
         This system has the following applications installed:
 
-"""
+"""]
         
-        for i, app in enumerate(INSTALLED_APPLICATIONS, 1):
-            details = self.app_metadata[app]
-            content += f"\n{i}. {app}\n"
-            content += f"   Version: {details['version']}\n"
-            content += f"   Installed: {details['install_date'].strftime('%m/%d/%Y')}\n"
-            content += f"   Size: {file_size_string(details['size_mb'] * 1024 * 1024)}\n"
-            content += f"   Last Used: {details['last_used'].strftime('%m/%d/%Y')}\n"
+        for i, details in enumerate(self.app_metadata.values(), 1):
+            parts.append(APP_LIST_ENTRY_TEMPLATE.format(index=i, **details))
         
-        content += f"""
+        parts.append("""
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -84,9 +231,9 @@ RAM: 32 GB
 Storage: 1 TB SSD
 
 ═══════════════════════════════════════════════════════════════════════════
-"""
+""")
         
-        return content
+        return "".join(parts)
     
     def generate_recent_apps_activity(self):
         """Generate recent applications activity"""
@@ -102,25 +249,26 @@ Storage: 1 TB SSD
             ("Spotify", "Music streaming, 40+ hours this month")
         ]
         
-        content = f"""RECENT APPLICATION ACTIVITY
+        now = datetime.now()
+        parts = [f"""RECENT APPLICATION ACTIVITY
 User: {USER_NAME}
 Period: Last 30 Days
 
 ═══════════════════════════════════════════════════════════════════════════
 
-"""
+"""]
         
         for app, activity in apps_with_activity:
-            last_used = datetime.now() - timedelta(hours=random.randint(1, 48))
+            last_used = now - timedelta(hours=random.randint(1, 48))
             usage_time = random.randint(20, 300)
             
-            content += f"{app}\n"
-            content += f"  Last Used: {last_used.strftime('%B %d, %Y at %I:%M %p')}\n"
-            content += f"  Total Time: {usage_time} hours\n"
-            content += f"  Activity: {activity}\n"
-            content += "-"*70 + "\n\n"
+            parts.append(f"{app}\n")
+            parts.append(f"  Last Used: {last_used.strftime('%B %d, %Y at %I:%M %p')}\n")
+            parts.append(f"  Total Time: {usage_time} hours\n")
+            parts.append(f"  Activity: {activity}\n")
+            parts.append("-"*70 + "\n\n")
         
-        return content
+        return "".join(parts)
     
     def generate_software_licenses(self):
         """Generate software license information"""
@@ -135,31 +283,32 @@ Period: Last 30 Days
             ("Slack Business+", "Subscription", "Per user/month", "$12.50/user", "Active")
         ]
         
-        content = f"""SOFTWARE LICENSE INFORMATION
+        now = datetime.now()
+        parts = [f"""SOFTWARE LICENSE INFORMATION
 {USER_NAME}
 {USER_EMAIL}
 
-Generated: {datetime.now().strftime('%B %d, %Y')}
+Generated: {now.strftime('%B %d, %Y')}
 
 ═══════════════════════════════════════════════════════════════════════════
 
-"""
+"""]
         
         for software, license_type, billing, cost, status in licenses:
-            renewal = datetime.now() + timedelta(days=random.randint(30, 365))
+            renewal = now + timedelta(days=random.randint(30, 365))
             
-            content += f"SOFTWARE: {software}\n"
-            content += f"License Type: {license_type}\n"
-            content += f"Billing: {billing}\n"
-            content += f"Cost: {cost}\n"
-            content += f"Status: {status}\n"
+            parts.append(f"SOFTWARE: {software}\n")
+            parts.append(f"License Type: {license_type}\n")
+            parts.append(f"Billing: {billing}\n")
+            parts.append(f"Cost: {cost}\n")
+            parts.append(f"Status: {status}\n")
             
             if status == "Active" and license_type == "Subscription":
-                content += f"Next Renewal: {renewal.strftime('%B %d, %Y')}\n"
+                parts.append(f"Next Renewal: {renewal.strftime('%B %d, %Y')}\n")
             
-            content += "-"*70 + "\n\n"
+            parts.append("-"*70 + "\n\n")
         
-        content += f"""
+        parts.append(f"""
 TOTAL ANNUAL SOFTWARE COSTS: Approximately $600/year
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -171,113 +320,65 @@ NOTES:
 • Keep licenses backed up in secure location
 
 ═══════════════════════════════════════════════════════════════════════════
-"""
+""")
         
-        return content
+        return "".join(parts)
     
     def generate_download_history(self):
         """Generate download history"""
         
-        downloads = [
-            ("ChromeSetup.exe", "Google Chrome installer", 1.3, "Chrome"),
-            ("FirefoxInstaller.exe", "Firefox installer", 54.2, "Firefox"),
-            ("MicrosoftEdgeSetup.exe", "Edge installer", 2.1, "Edge"),
-            ("vlc-3.0.20-win64.exe", "VLC installer", 40.5, "Chrome"),
-            ("ZoomInstallerFull.msi", "Zoom client", 67.2, "Edge"),
-            ("winrar-x64-701.exe", "WinRAR archive utility", 3.4, "Firefox"),
-            ("7z2408-x64.exe", "7-Zip archive utility", 1.7, "Chrome"),
-            ("Docker_Desktop_Installer.exe", "Docker Desktop", 512.0, "Chrome"),
-            ("Git-2.42.0-64-bit.exe", "Git for Windows", 48.5, "Edge"),
-            ("NotepadPlusPlus-8.6.2-x64.exe", "Notepad++", 4.5, "Firefox"),
-            ("BoxDrive.msi", "Box Drive client", 34.4, "Chrome"),
-            ("SlackSetup.exe", "Slack desktop", 93.7, "Chrome"),
-            ("spotify_installer.exe", "Spotify", 1.1, "Edge"),
-            ("AdobeReader_DC_Installer.exe", "Adobe Acrobat Reader", 201.2, "Firefox"),
-            ("project_budget.xlsx", "Q4 budget spreadsheet", 0.9, "Chrome"),
-            ("client_contract.docx", "Client contract draft", 0.4, "Edge"),
-            ("tax_returns_2024.zip", "Tax returns bundle", 12.8, "Chrome"),
-            ("logs_archive_2024-01-05.7z", "System logs", 6.1, "Firefox"),
-            ("meeting_notes.txt", "Team sync notes", 0.02, "Edge"),
-            ("design_assets_v3.rar", "Design assets", 48.2, "Chrome"),
-            ("invoice_2024-11-15.pdf", "Vendor invoice", 0.3, "Edge"),
-            ("aws_architecture_diagram.png", "Architecture diagram", 0.8, "Firefox"),
-        ]
-        
-        content = f"""DOWNLOAD HISTORY
+        now = datetime.now()
+        parts = [f"""DOWNLOAD HISTORY
 User: {USER_NAME}
 Last 30 Days
 
 ═══════════════════════════════════════════════════════════════════════════
 
-"""
+"""]
         
-        for filename, description, size_mb, source in downloads:
-            download_date = datetime.now() - timedelta(days=random.randint(1, 30))
+        days_ago = random_ints(1, 30, len(_DOWNLOADS_PREFORMATTED))
+        for (filename, description, size_str, source), days in zip(_DOWNLOADS_PREFORMATTED, days_ago):
+            download_date = now - timedelta(days=days)
             
-            content += f"File: {filename}\n"
-            content += f"Description: {description}\n"
-            content += f"Size: {file_size_string(int(size_mb * 1024 * 1024))}\n"
-            content += f"Downloaded: {download_date.strftime('%B %d, %Y at %I:%M %p')}\n"
-            content += f"Status: Complete via {source}\n"
-            content += "-"*70 + "\n\n"
+            parts.append(f"File: {filename}\n")
+            parts.append(f"Description: {description}\n")
+            parts.append(f"Size: {size_str}\n")
+            parts.append(f"Downloaded: {download_date.strftime('%B %d, %Y at %I:%M %p')}\n")
+            parts.append(f"Status: Complete via {source}\n")
+            parts.append("-"*70 + "\n\n")
         
-        return content
+        return "".join(parts)
 
-    def generate_fake_installers(self):
+    def generate_fake_installers(self, installers=None):
         """
         Create fake installer binaries in Downloads/Software_Installers with
         realistic filenames and checksum metadata.
+        installers: (installer_name, details, size_kb) rows from
+        _plan_per_app_outputs; planned here when not given.
         """
+        if installers is None:
+            installers = self._plan_per_app_outputs()[1]
         installers_dir = self.base_path / "Downloads" / "Software_Installers"
         ensure_directory(installers_dir)
 
-        created = []
-        manifest_lines = ["FAKE INSTALLERS (placeholders for sandbox realism)\n"]
+        installer_paths = [installers_dir / installer_name for installer_name, _, _ in installers]
+        sizes_kb = [size_kb for _, _, size_kb in installers]
+        seeds = self._stub_seeds(len(installers))
+        with ThreadPoolExecutor() as pool:
+            checksums = list(pool.map(self._make_stub_binary, installer_paths, sizes_kb, seeds))
 
-        extension_overrides = {
-            "Google Chrome": "ChromeSetup.exe",
-            "Mozilla Firefox": "FirefoxInstaller.exe",
-            "Microsoft Edge": "MicrosoftEdgeSetup.exe",
-            "Microsoft Teams": "TeamsSetup.exe",
-            "Zoom": "ZoomInstallerFull.msi",
-            "VLC Media Player": "vlc-3.0.20-win64.exe",
-            "WinRAR": "winrar-x64-701.exe",
-            "7-Zip": "7z2408-x64.exe",
-            "Visual Studio Code": "VSCodeUserSetup-x64-1.84.2.exe",
-            "Docker Desktop": "Docker Desktop Installer.exe",
-            "Git": "Git-2.42.0-64-bit.exe",
-            "Google Drive": "GoogleDriveFSSetup.exe",
-            "Dropbox": "DropboxInstaller.exe",
-            "Microsoft OneDrive": "OneDriveSetup.exe",
-            "Box": "BoxDrive.msi",
-            "Spotify": "spotify_installer.exe",
-            "Slack": "SlackSetup.exe",
-            "Notepad++": "NotepadPlusPlus-8.6.2-x64.exe",
-            "Adobe Acrobat Reader DC": "AdobeReader_DC_Installer.exe",
-        }
-
-        for app, details in self.app_metadata.items():
-            installer_name = extension_overrides.get(
-                app, f"{app.replace(' ', '_')}_Setup.exe"
-            )
-            installer_path = installers_dir / installer_name
-
-            # vary size to look more natural
-            size_kb = random.randint(1800, 52000)  # ~2MB to ~50MB
-            self._make_stub_binary(installer_path, size_kb=size_kb)
-
-            checksum = hashlib.sha256(installer_path.read_bytes()).hexdigest()
-            created.append(installer_path)
+        manifest_lines = ["FAKE INSTALLERS (placeholders for sandbox realism)\n"]
+        for (installer_name, details, _), checksum in zip(installers, checksums):
             manifest_lines.append(
                 f"{installer_name} | v{details['version']} | "
-                f"{details['install_date'].strftime('%Y-%m-%d')} | "
+                f"{details['install_date_ymd']} | "
                 f"sha256={checksum}"
             )
-
         manifest = installers_dir / "INSTALLERS_MANIFEST.txt"
-        manifest.write_text("\n".join(manifest_lines) + "\n", encoding="utf-8")
-        created.append(manifest)
-        return created
+        with open(manifest, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as handle:
+            handle.writelines(line + "\n" for line in manifest_lines)
+
+        return installer_paths + [manifest]
 
     def _write_text_placeholder(self, path: Path, title: str, body: str):
         path.write_text(f"{title}\n\n{body}\n", encoding="utf-8")
@@ -305,11 +406,14 @@ Last 30 Days
             ("aws_architecture_diagram.png", "AWS Architecture Diagram", "PNG placeholder"),
         ]
 
+        stub_paths = []
+        stub_sizes_kb = []
+
         # Archives
         for filename, size_mb in archive_targets:
             path = downloads_dir / filename
-            size_kb = max(int(size_mb * 1024), 512)
-            self._make_stub_binary(path, size_kb=size_kb)
+            stub_paths.append(path)
+            stub_sizes_kb.append(max(int(size_mb * 1024), 512))
             created.append(path)
 
         # Documents / PDFs / text
@@ -317,94 +421,124 @@ Last 30 Days
             path = downloads_dir / filename
             if filename.endswith((".docx", ".xlsx", ".pdf")):
                 # use binary so size isn't too small
-                self._make_stub_binary(path, size_kb=random.randint(250, 1200))
+                stub_paths.append(path)
+                stub_sizes_kb.append(random.randint(250, 1200))
             elif filename.endswith(".png"):
-                self._make_stub_binary(path, size_kb=random.randint(120, 600))
+                stub_paths.append(path)
+                stub_sizes_kb.append(random.randint(120, 600))
             else:
                 self._write_text_placeholder(path, title, summary)
             created.append(path)
 
+        stub_seeds = self._stub_seeds(len(stub_paths))
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(self._make_stub_binary, stub_paths, stub_sizes_kb, stub_seeds))
+
         return created
 
-    def generate_application_usage_history(self):
+    def generate_application_usage_history(self, usage_entries=None):
         """
         Generate a consolidated application usage history file.
+        usage_entries: per-app stanzas from _plan_per_app_outputs; planned
+        here when not given.
         """
+        if usage_entries is None:
+            usage_entries = self._plan_per_app_outputs()[2]
         lines = [
             f"APPLICATION USAGE HISTORY - Last 60 Days",
             f"User: {USER_NAME}",
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             "",
+            *usage_entries,
         ]
-        for app, details in self.app_metadata.items():
-            sessions = random.randint(3, 45)
-            avg_minutes = random.randint(5, 80)
-            last_session = details["last_used"].strftime('%Y-%m-%d %H:%M:%S')
-            lines.append(f"{app}")
-            lines.append(f"  Sessions: {sessions}")
-            lines.append(f"  Avg Session Length: {avg_minutes} minutes")
-            lines.append(f"  Last Used: {last_session}")
-            lines.append("  Launch Method: Start Menu / Taskbar")
-            lines.append("-" * 70)
         return "\n".join(lines) + "\n"
 
-    def materialize_installation_folders(self):
+    def _write_app_footprint(self, details, install_dir, usage_log_dir, sessions, update_check):
         """
-        Create realistic installation directories so the filesystem looks used.
+        Write install.log, config.ini and the roaming usage.log for one app.
+        Both directories (plain strings) must already exist.
         """
-        created_files = []
-        program_files = Path(self.paths.get("program_files", self.base_path / "Program Files"))
-        roaming_appdata = Path(self.paths.get("appdata_roaming", self.base_path / "AppData" / "Roaming"))
-        ensure_directory(program_files)
-        ensure_directory(roaming_appdata)
-
-        for app, details in self.app_metadata.items():
-            safe_name = app.replace(" ", "_")
-            install_dir = program_files / safe_name
-            ensure_directory(install_dir)
-
-            install_log = install_dir / "install.log"
-            install_log.write_text(
-                (
-                    f"{app} installation log\n"
-                    f"Version: {details['version']}\n"
-                    f"Installed: {details['install_date'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    f"Last Launched: {details['last_used'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    "Status: Completed successfully\n"
-                ),
-                encoding="utf-8",
-            )
-            created_files.append(install_log)
-
-            settings_file = install_dir / "config.ini"
-            settings_file.write_text(
-                (
-                    "[General]\n"
-                    f"install_path={install_dir}\n"
-                    f"user={USER_NAME}\n"
-                    "auto_update=true\n"
-                    f"last_update_check={datetime.now().strftime('%Y-%m-%d')}\n"
+        files = (
+            (os.path.join(install_dir, "install.log"), INSTALL_LOG_TEMPLATE.format_map(details)),
+            (
+                os.path.join(install_dir, "config.ini"),
+                CONFIG_INI_TEMPLATE.format(
+                    install_dir=install_dir, user=USER_NAME, update_check=update_check
                 ),
-                encoding="utf-8",
+            ),
+            (os.path.join(usage_log_dir, "usage.log"), USAGE_LOG_TEMPLATE.format(sessions=sessions, **details)),
+        )
+        for path, text in files:
+            with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as handle:
+                handle.write(text)
+
+        return [Path(path) for path, _ in files]
+
+    def materialize_installation_folders(self, footprints=None):
+        """
+        Create realistic installation directories so the filesystem looks used.
+        footprints: (details, install_dir, usage_log_dir, sessions) rows from
+        _plan_per_app_outputs; planned here when not given.
+        """
+        if footprints is None:
+            footprints = self._plan_per_app_outputs()[0]
+
+        # Create each directory once up front rather than once per file
+        for _, install_dir, usage_log_dir, _ in footprints:
+            os.makedirs(install_dir, exist_ok=True)
+            os.makedirs(usage_log_dir, exist_ok=True)
+
+        update_check = datetime.now().strftime('%Y-%m-%d')
+        install_files = []
+        with ThreadPoolExecutor() as pool:
+            futures = [
+                pool.submit(self._write_app_footprint, details, install_dir, usage_log_dir, sessions, update_check)
+                for details, install_dir, usage_log_dir, sessions in footprints
+            ]
+            for future in futures:
+                install_files.extend(future.result())
+        return install_files
+
+    def _plan_per_app_outputs(self):
+        """
+        Single pass over app_metadata that lays out the install footprints,
+        installer stubs and usage-history entries from one set of batched
+        draws. Nothing is written here.
+        """
+        # Plain string joins for the footprint dirs; Path objects only at the boundary
+        program_files = os.fspath(self.paths.get("program_files", self.base_path / "Program Files"))
+        roaming_appdata = os.fspath(self.paths.get("appdata_roaming", self.base_path / "AppData" / "Roaming"))
+
+        count = len(self.app_metadata)
+        draws = zip(
+            random_ints(1800, 52000, count),  # installer size, ~2MB to ~50MB
+            random_ints(3, 40, count),  # sessions in usage.log
+            random_ints(3, 45, count),  # sessions in usage history
+            random_ints(5, 80, count),  # avg session minutes
+        )
+        footprints = []
+        installers = []
+        usage_entries = []
+        for (app, details), (installer_kb, footprint_sessions, usage_sessions, avg_minutes) in zip(
+            self.app_metadata.items(), draws
+        ):
+            safe_name = details["safe_name"]
+            footprints.append((
+                details,
+                os.path.join(program_files, safe_name),
+                os.path.join(roaming_appdata, safe_name),
+                footprint_sessions,
+            ))
+            installers.append(
+                (INSTALLER_FILENAMES.get(app, f"{safe_name}_Setup.exe"), details, installer_kb)
             )
-            created_files.append(settings_file)
-
-            usage_log_dir = roaming_appdata / safe_name
-            ensure_directory(usage_log_dir)
-            usage_log = usage_log_dir / "usage.log"
-            usage_log.write_text(
-                (
-                    f"App: {app}\n"
-                    f"Sessions this month: {random.randint(3, 40)}\n"
-                    f"Last used: {details['last_used'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    "Recent files opened: cache.db; settings.json; preferences.xml\n"
-                ),
-                encoding="utf-8",
+            usage_entries.append(
+                USAGE_HISTORY_ENTRY_TEMPLATE.format(
+                    sessions=usage_sessions, avg_minutes=avg_minutes, **details
+                )
             )
-            created_files.append(usage_log)
+        return footprints, installers, usage_entries
 
-        return created_files
-    
     def generate_all_application_data(self):
         """Generate all application-related data"""
         created_files = []
@@ -443,11 +577,14 @@ Last 30 Days
         created_files.append(history_file)
         print(f"    ✓ Download history")
 
-        install_files = self.materialize_installation_folders()
+        # One pass over app_metadata feeds the footprints, installers and usage history
+        footprints, installers, usage_entries = self._plan_per_app_outputs()
+
+        install_files = self.materialize_installation_folders(footprints)
         created_files.extend(install_files)
         print(f"    ✓ Application install footprints ({len(install_files)} files)")
 
-        installer_files = self.generate_fake_installers()
+        installer_files = self.generate_fake_installers(installers)
         created_files.extend(installer_files)
         print(f"    ✓ Fake installers created ({len(installer_files)} files)")
 
@@ -455,7 +592,7 @@ Last 30 Days
         created_files.extend(artifact_files)
         print(f"    ✓ Download artifacts created ({len(artifact_files)} files)")
 
-        usage_history = self.generate_application_usage_history()
+        usage_history = self.generate_application_usage_history(usage_entries)
         usage_file = downloads_folder / "Application_Usage_History.txt"
         usage_file.write_text(usage_history, encoding="utf-8")
         created_files.append(usage_file)
@@ -4,6 +4,9 @@ Browser Data Generator
 Creates realistic browser history, credentials, and cookies for Chrome, Firefox, and Edge
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, chain
 import json
 import random
 import sqlite3
@@ -19,14 +22,218 @@ from config import (
     BROWSER_PROFILE_NAMES,
 )
 from utils.helpers import (
-    random_string,
-    random_date,
+    random_ints,
     ensure_directory,
     chrome_timestamp,
     firefox_timestamp,
-    write_text_file,
+    write_utf8,
 )
 
+# Share of history visits per COMMON_WEBSITES category
+SITE_CATEGORY_WEIGHTS = {
+    "work": 35,
+    "social": 15,
+    "news": 20,
+    "finance": 10,
+    "shopping": 10,
+    "entertainment": 8,
+    "email": 2
+}
+
+# Flattened (site, weight) table: each site gets an equal share of its
+# category's weight, so one weighted draw picks category and site together
+HISTORY_SITES = [
+    site
+    for category in SITE_CATEGORY_WEIGHTS
+    for site in COMMON_WEBSITES[category]
+]
+HISTORY_SITE_CUM_WEIGHTS = list(accumulate(
+    weight / len(COMMON_WEBSITES[category])
+    for category, weight in SITE_CATEGORY_WEIGHTS.items()
+    for _ in COMMON_WEBSITES[category]
+))
+
+HISTORY_PATHS = [
+    "", "/dashboard", "/search?q=python+tutorial", "/docs",
+    "/settings", "/profile", "/notifications", "/about"
+]
+
+# Some sites are visited more often than others
+VISIT_COUNTS = [1, 2, 3, 5, 10]
+VISIT_COUNT_WEIGHTS = [50, 25, 15, 7, 3]
+
+COOKIE_TYPES = [
+    ("session_id", "Session identifier"),
+    ("auth_token", "Authentication token"),
+    ("user_prefs", "User preferences"),
+    ("tracking_id", "Analytics tracking"),
+    ("csrf_token", "CSRF protection"),
+    ("language", "Language preference"),
+    ("timezone", "Timezone setting")
+]
+
+PAGE_TITLES = {
+    "github.com": "GitHub: Where the world builds software",
+    "stackoverflow.com": "Stack Overflow - Where Developers Learn",
+    "linkedin.com": "LinkedIn: Log In or Sign Up",
+    "amazon.com": "Amazon.com: Online Shopping",
+    "youtube.com": "YouTube",
+    "gmail.com": "Gmail - Email by Google",
+    "netflix.com": "Netflix - Watch TV Shows Online",
+    "reddit.com": "Reddit - Dive into anything",
+}
+
+
+@lru_cache(maxsize=None)
+def _page_title_for_site(site):
+    """Exact-domain title, else first substring match (e.g. subdomains), else generic"""
+    title = PAGE_TITLES.get(site)
+    if title is not None:
+        return title
+    for key, title in PAGE_TITLES.items():
+        if key in site:
+            return title
+    domain = site.split('.')[0].capitalize()
+    return f"{domain} - Home"
+
+
+# History DBs are throwaway sandbox artifacts, so trade durability for speed
+HISTORY_DB_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
+)
+
+CHROMIUM_INSERT_URLS_SQL = (
+    "INSERT INTO urls (id, url, title, visit_count, typed_count, last_visit_time, hidden) "
+    "VALUES (?, ?, ?, ?, ?, ?, 0)"
+)
+CHROMIUM_INSERT_VISITS_SQL = (
+    "INSERT INTO visits (id, url, visit_time, from_visit, transition, segment_id, visit_duration) "
+    "VALUES (?, ?, ?, 0, 805306368, NULL, ?)"
+)
+FIREFOX_INSERT_PLACES_SQL = (
+    "INSERT INTO moz_places (id, url, title, rev_host, visit_count, typed, frecency, last_visit_date) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+FIREFOX_INSERT_VISITS_SQL = (
+    "INSERT INTO moz_historyvisits (id, from_visit, place_id, visit_date, visit_type, session) "
+    "VALUES (?, 0, ?, ?, 1, 0)"
+)
+
+# Browsers keep their profile JSON compact, so skip indentation and spaces
+PROFILE_JSON_SEPARATORS = (",", ":")
+
+# Bound-parameter ceiling for a single statement (SQLite's historic default)
+SQLITE_MAX_VARIABLES = 999
+
+
+def _bulk_insert(cur, insert_sql, rows):
+    """
+    Insert rows using multi-row VALUES statements built from a single-row
+    INSERT, chunked so each statement stays under SQLITE_MAX_VARIABLES.
+    """
+    if not rows:
+        return
+    head, row_values = insert_sql.rsplit("VALUES ", 1)
+    rows_per_statement = max(1, SQLITE_MAX_VARIABLES // len(rows[0]))
+    for start in range(0, len(rows), rows_per_statement):
+        batch = rows[start:start + rows_per_statement]
+        cur.execute(
+            head + "VALUES " + ", ".join([row_values] * len(batch)),
+            list(chain.from_iterable(batch)),
+        )
+
+
+def _chromium_logins(passwords):
+    """Chromium 'Login Data' export shape, shared by Chrome and Edge"""
+    return [
+        {
+            "origin_url": pwd["url"],
+            "username": pwd["username"],
+            "password": pwd["password"],
+            "date_created": pwd["date_created"].isoformat(),
+            "times_used": pwd["times_used"],
+        }
+        for pwd in passwords
+    ]
+
+
+def _firefox_logins(passwords):
+    """Firefox stores a JSON logins file; mimic that structure"""
+    # Never changed since creation, so both timestamps share one conversion
+    created_timestamps = [firefox_timestamp(pwd["date_created"]) for pwd in passwords]
+    return {
+        "nextId": len(passwords) + 1,
+        "logins": [
+            {
+                "id": idx + 1,
+                "hostname": pwd["url"],
+                "httpRealm": None,
+                "formSubmitURL": pwd["url"],
+                "usernameField": "username",
+                "passwordField": "password",
+                "encryptedUsername": pwd["username"],
+                "encryptedPassword": pwd["password"],
+                "timeCreated": created_ts,
+                "timePasswordChanged": created_ts,
+                "timesUsed": pwd["times_used"],
+            }
+            for idx, (pwd, created_ts) in enumerate(zip(passwords, created_timestamps))
+        ],
+    }
+
+
+# Per-browser saved-password layout: profile JSON shape and summary wording
+CREDENTIAL_FORMATS = {
+    "chrome": {
+        "label": "Google Chrome",
+        "profile_file": "Login Data.json",
+        "logins": _chromium_logins,
+        "summary_file": "Saved_Passwords.txt",
+        "total_label": "Total saved passwords",
+        "row": (
+            "Website: {url}\n"
+            "Username: {username}\n"
+            "Password: {password}\n"
+            "Created: {date_created:%Y-%m-%d}\n"
+            "Times Used: {times_used}\n"
+            + "-"*70 + "\n\n"
+        ),
+    },
+    "firefox": {
+        "label": "Mozilla Firefox",
+        "profile_file": "logins.json",
+        "logins": _firefox_logins,
+        "summary_file": "Saved_Passwords_Firefox.txt",
+        "total_label": "Total saved logins",
+        "row": (
+            "Site: {url}\n"
+            "Username: {username}\n"
+            "Password: {password}\n"
+            "Date Created: {date_created:%Y-%m-%d %H:%M:%S}\n"
+            "Used {times_used} times\n"
+            + "-"*70 + "\n\n"
+        ),
+    },
+    "edge": {
+        "label": "Microsoft Edge",
+        "profile_file": "Login Data.json",
+        "logins": _chromium_logins,
+        "summary_file": "Saved_Passwords_Edge.txt",
+        "total_label": "Total passwords saved",
+        "row": (
+            "URL: {url}\n"
+            "Username: {username}\n"
+            "Password: {password}\n"
+            "Created: {date_created:%Y-%m-%d}\n"
+            "Usage Count: {times_used}\n"
+            + "-"*70 + "\n\n"
+        ),
+    },
+}
+
 
 class BrowserDataGenerator:
     """Generates realistic browser data (history, credentials, cookies)"""
@@ -37,6 +244,10 @@ class BrowserDataGenerator:
         self.browser_data = {}
         self.profile_paths = self._build_profile_paths()
 
+    def _browser_output_dir(self, browser_name):
+        """Documents folder holding a browser's readable summaries"""
+        return self.base_path / "Documents" / f"Browser_Data_{browser_name}"
+
     def _build_profile_paths(self):
         """
         Build realistic browser profile paths under the base path
@@ -68,106 +279,98 @@ class BrowserDataGenerator:
         
     def generate_browsing_history(self, num_entries=200):
         """Generate realistic browsing history"""
-        history = []
         end_date = datetime.now()
         start_date = end_date - timedelta(days=90)
-        
-        # Weight different types of sites
-        site_weights = {
-            "work": 35,
-            "social": 15,
-            "news": 20,
-            "finance": 10,
-            "shopping": 10,
-            "entertainment": 8,
-            "email": 2
-        }
-        
-        for _ in range(num_entries):
-            # Select category
-            category = random.choices(
-                list(site_weights.keys()),
-                weights=list(site_weights.values()),
-                k=1
-            )[0]
-            
-            # Select site from category
-            site = random.choice(COMMON_WEBSITES[category])
-            
-            # Generate random path for some sites
-            paths = [
-                "", "/dashboard", "/search?q=python+tutorial", "/docs",
-                "/settings", "/profile", "/notifications", "/about"
-            ]
-            path = random.choice(paths)
-            
-            # Random visit time
-            visit_time = random_date(start_date, end_date)
-            
-            # Visit count (some sites visited more often)
-            visit_count = random.choices([1, 2, 3, 5, 10], weights=[50, 25, 15, 7, 3])[0]
-            
-            history.append({
+
+        # Draw every column in one call each instead of several calls per entry
+        sites = random.choices(HISTORY_SITES, cum_weights=HISTORY_SITE_CUM_WEIGHTS, k=num_entries)
+        paths = random.choices(HISTORY_PATHS, k=num_entries)
+        day_offsets = random_ints(0, (end_date - start_date).days - 1, num_entries)
+        # Columns are independent draws, so ordering the offsets yields a
+        # history already sorted by visit time
+        day_offsets.sort()
+        visit_counts = random.choices(VISIT_COUNTS, weights=VISIT_COUNT_WEIGHTS, k=num_entries)
+
+        history = [
+            {
                 "url": f"https://{site}{path}",
+                "site": site,
                 "title": self._generate_page_title(site, path),
-                "visit_time": visit_time,
+                "visit_time": start_date + timedelta(days=days),
                 "visit_count": visit_count,
                 "typed_count": 1 if visit_count > 5 else 0
-            })
-        
-        # Sort by visit time
-        history.sort(key=lambda x: x["visit_time"])
+            }
+            for site, path, days, visit_count in zip(sites, paths, day_offsets, visit_counts)
+        ]
         return history
     
+    def _history_subset(self, history, count):
+        """Random subset of an already sorted history that keeps its time order"""
+        if count >= len(history):
+            return history
+        keep = sorted(random.sample(range(len(history)), count))
+        return [history[idx] for idx in keep]
+
     def _generate_page_title(self, site, path):
         """Generate realistic page title"""
-        titles = {
-            "github.com": "GitHub: Where the world builds software",
-            "stackoverflow.com": "Stack Overflow - Where Developers Learn",
-            "linkedin.com": "LinkedIn: Log In or Sign Up",
-            "amazon.com": "Amazon.com: Online Shopping",
-            "youtube.com": "YouTube",
-            "gmail.com": "Gmail - Email by Google",
-            "netflix.com": "Netflix - Watch TV Shows Online",
-            "reddit.com": "Reddit - Dive into anything",
-        }
-        
-        for key, title in titles.items():
-            if key in site:
-                return title
-        
-        # Generic title
-        domain = site.split('.')[0].capitalize()
-        return f"{domain} - Home"
+        return _page_title_for_site(site)
+
+    def _connect_history_db(self):
+        """
+        Open an in-memory history DB with an open transaction. It is copied to
+        disk in one pass by _save_history_db once fully populated.
+        """
+        # Manual transaction control: no implicit BEGINs from the sqlite3 module
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        # Schema and every insert share one transaction, committed once
+        conn.execute("BEGIN")
+        return conn
+
+    def _save_history_db(self, conn, db_path):
+        """
+        Commit the in-memory DB and back it up to db_path. The backup replaces
+        every page of an existing file, so stale DBs need no unlink first.
+        """
+        conn.execute("COMMIT")
+
+        disk = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            for pragma in HISTORY_DB_PRAGMAS:
+                disk.execute(pragma)
+            conn.backup(disk)
+        finally:
+            disk.close()
+            conn.close()
+        return db_path
 
     def _write_history_summary(self, browser_label, history, summary_dir):
         """Write a lightweight human-readable summary file for quick review."""
         ensure_directory(summary_dir)
         summary_file = Path(summary_dir) / "History_Summary.txt"
 
-        content = f"# {browser_label} Browsing History Summary\n"
-        content += f"# User: {USER_NAME}\n"
-        content += "# Generated for sandbox realism\n\n"
-
+        parts = [
+            f"# {browser_label} Browsing History Summary\n"
+            f"# User: {USER_NAME}\n"
+            "# Generated for sandbox realism\n\n"
+        ]
         for entry in history[-50:]:
-            content += f"[{entry['visit_time'].strftime('%Y-%m-%d %H:%M:%S')}] "
-            content += f"{entry['title']}\n"
-            content += f"  URL: {entry['url']}\n"
-            content += f"  Visits: {entry['visit_count']}\n\n"
+            parts.append(
+                f"[{entry['visit_time'].strftime('%Y-%m-%d %H:%M:%S')}] "
+                f"{entry['title']}\n"
+                f"  URL: {entry['url']}\n"
+                f"  Visits: {entry['visit_count']}\n\n"
+            )
 
-        summary_file.write_text(content, encoding='utf-8')
+        write_utf8(summary_file, "".join(parts))
         return summary_file
 
-    def _write_chromium_history_db(self, history, profile_path, filename="History"):
+    def _write_chromium_history_db(self, history, profile_path, filename="History", durations=None):
         """
         Write a minimal but correctly shaped Chromium history SQLite DB.
         """
         ensure_directory(profile_path)
         db_path = Path(profile_path) / filename
-        if db_path.exists():
-            db_path.unlink()
-
-        conn = sqlite3.connect(db_path)
+        conn = self._connect_history_db()
         cur = conn.cursor()
         cur.execute(
             """
@@ -196,33 +399,33 @@ class BrowserDataGenerator:
             """
         )
 
-        for idx, entry in enumerate(history, 1):
-            visit_ts = chrome_timestamp(entry["visit_time"])
-            cur.execute(
-                """
-                INSERT INTO urls (id, url, title, visit_count, typed_count, last_visit_time, hidden)
-                VALUES (?, ?, ?, ?, ?, ?, 0)
-                """,
-                (
-                    idx,
-                    entry["url"],
-                    entry["title"],
-                    entry["visit_count"],
-                    entry["typed_count"],
-                    visit_ts,
-                ),
-            )
-            cur.execute(
-                """
-                INSERT INTO visits (id, url, visit_time, from_visit, transition, segment_id, visit_duration)
-                VALUES (?, ?, ?, 0, 805306368, NULL, ?)
-                """,
-                (idx, idx, visit_ts, random.randint(5, 180) * 1_000_000),
+        visit_timestamps = [chrome_timestamp(entry["visit_time"]) for entry in history]
+        urls_rows = [
+            (
+                idx,
+                entry["url"],
+                entry["title"],
+                entry["visit_count"],
+                entry["typed_count"],
+                visit_ts,
             )
+            for idx, (entry, visit_ts) in enumerate(zip(history, visit_timestamps), 1)
+        ]
+        # Visit durations (5s-180s, in microseconds) drawn in one batch
+        if durations is None:
+            durations = self._draw_visit_durations(history)
+        visits_rows = [
+            (idx, idx, visit_ts, seconds * 1_000_000)
+            for idx, (visit_ts, seconds) in enumerate(zip(visit_timestamps, durations), 1)
+        ]
+        _bulk_insert(cur, CHROMIUM_INSERT_URLS_SQL, urls_rows)
+        _bulk_insert(cur, CHROMIUM_INSERT_VISITS_SQL, visits_rows)
 
-        conn.commit()
-        conn.close()
-        return db_path
+        return self._save_history_db(conn, db_path)
+
+    def _draw_visit_durations(self, history):
+        """Visit durations in seconds, one per history entry"""
+        return random_ints(5, 180, len(history))
 
     def _write_firefox_history_db(self, history, profile_path):
         """
@@ -230,10 +433,7 @@ class BrowserDataGenerator:
         """
         ensure_directory(profile_path)
         db_path = Path(profile_path) / "places.sqlite"
-        if db_path.exists():
-            db_path.unlink()
-
-        conn = sqlite3.connect(db_path)
+        conn = self._connect_history_db()
         cur = conn.cursor()
         cur.execute(
             """
@@ -263,62 +463,61 @@ class BrowserDataGenerator:
             """
         )
 
-        for idx, entry in enumerate(history, 1):
-            visit_ts = firefox_timestamp(entry["visit_time"])
-            rev_host = ".".join(entry["url"].split("//")[-1].split(".")[::-1])
-            frecency = entry["visit_count"] * 100
-            cur.execute(
-                """
-                INSERT INTO moz_places (id, url, title, rev_host, visit_count, typed, frecency, last_visit_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    idx,
-                    entry["url"],
-                    entry["title"],
-                    rev_host,
-                    entry["visit_count"],
-                    entry["typed_count"],
-                    frecency,
-                    visit_ts,
-                ),
-            )
-            cur.execute(
-                """
-                INSERT INTO moz_historyvisits (id, from_visit, place_id, visit_date, visit_type, session)
-                VALUES (?, 0, ?, ?, 1, 0)
-                """,
-                (idx, idx, visit_ts),
+        visit_timestamps = [firefox_timestamp(entry["visit_time"]) for entry in history]
+        # Firefox stores the host reversed with a trailing dot; few unique sites
+        rev_hosts = {}
+        for entry in history:
+            site = entry["site"]
+            if site not in rev_hosts:
+                rev_hosts[site] = site[::-1] + "."
+        places_rows = [
+            (
+                idx,
+                entry["url"],
+                entry["title"],
+                rev_hosts[entry["site"]],
+                entry["visit_count"],
+                entry["typed_count"],
+                entry["visit_count"] * 100,  # frecency
+                visit_ts,
             )
+            for idx, (entry, visit_ts) in enumerate(zip(history, visit_timestamps), 1)
+        ]
+        visits_rows = [
+            (idx, idx, visit_ts) for idx, visit_ts in enumerate(visit_timestamps, 1)
+        ]
+        _bulk_insert(cur, FIREFOX_INSERT_PLACES_SQL, places_rows)
+        _bulk_insert(cur, FIREFOX_INSERT_VISITS_SQL, visits_rows)
 
-        conn.commit()
-        conn.close()
-        return db_path
+        return self._save_history_db(conn, db_path)
     
-    def generate_chrome_history(self, output_dir):
+    def generate_chrome_history(self, output_dir, history=None, durations=None):
         """Generate Chrome browsing history"""
-        history = self.generate_browsing_history(250)
+        if history is None:
+            history = self.generate_browsing_history(250)
         profile_dir = self.profile_paths["chrome"]
 
-        history_db = self._write_chromium_history_db(history, profile_dir, "History")
+        history_db = self._write_chromium_history_db(history, profile_dir, "History", durations)
         summary_file = self._write_history_summary("Google Chrome", history, output_dir)
         return [history_db, summary_file]
     
-    def generate_firefox_history(self, output_dir):
+    def generate_firefox_history(self, output_dir, history=None):
         """Generate Firefox browsing history"""
-        history = self.generate_browsing_history(200)
+        if history is None:
+            history = self.generate_browsing_history(200)
         profile_dir = self.profile_paths["firefox"]
 
         history_db = self._write_firefox_history_db(history, profile_dir)
         summary_file = self._write_history_summary("Mozilla Firefox", history, output_dir)
         return [history_db, summary_file]
     
-    def generate_edge_history(self, output_dir):
+    def generate_edge_history(self, output_dir, history=None, durations=None):
         """Generate Microsoft Edge browsing history"""
-        history = self.generate_browsing_history(180)
+        if history is None:
+            history = self.generate_browsing_history(180)
         profile_dir = self.profile_paths["edge"]
 
-        history_db = self._write_chromium_history_db(history, profile_dir, "History")
+        history_db = self._write_chromium_history_db(history, profile_dir, "History", durations)
         summary_file = self._write_history_summary("Microsoft Edge", history, output_dir)
         return [history_db, summary_file]
     
@@ -338,161 +537,88 @@ class BrowserDataGenerator:
         
         return passwords
     
-    def generate_chrome_credentials(self, output_dir):
-        """Generate Chrome saved passwords file"""
-        passwords = self.generate_saved_passwords()
-        profile_dir = self.profile_paths["chrome"]
-
-        creds_json = [
-            {
-                "origin_url": pwd["url"],
-                "username": pwd["username"],
-                "password": pwd["password"],
-                "date_created": pwd["date_created"].isoformat(),
-                "times_used": pwd["times_used"],
-            }
-            for pwd in passwords
+    def _write_credentials(self, browser, output_dir, passwords=None, logins_cache=None):
+        """
+        Write the profile logins JSON and the readable summary for one browser,
+        laid out per CREDENTIAL_FORMATS. Browsers that share a logins shape
+        reuse the rendered JSON through logins_cache when one is passed.
+        """
+        fmt = CREDENTIAL_FORMATS[browser]
+        if passwords is None:
+            passwords = self.generate_saved_passwords()
+
+        build_logins = fmt["logins"]
+        logins_json = logins_cache.get(build_logins) if logins_cache is not None else None
+        if logins_json is None:
+            logins_json = json.dumps(build_logins(passwords), separators=PROFILE_JSON_SEPARATORS)
+            if logins_cache is not None:
+                logins_cache[build_logins] = logins_json
+        profile_dir = ensure_directory(self.profile_paths[browser])
+        creds_profile_file = profile_dir / fmt["profile_file"]
+        write_utf8(creds_profile_file, logins_json)
+
+        summary_file = Path(output_dir) / fmt["summary_file"]
+        parts = [
+            f"# {fmt['label']} - Saved Passwords (summary)\n"
+            f"# User: {USER_NAME} ({USER_EMAIL})\n"
+            "# WARNING: FAKE credentials for sandbox analysis\n\n"
+            f"{fmt['total_label']}: {len(passwords)}\n\n"
+            + "="*70 + "\n\n"
         ]
-        
-        creds_profile_file = write_text_file(
-            Path(profile_dir) / "Login Data.json",
-            json.dumps(creds_json, indent=2),
-        )
-
-        summary_file = Path(output_dir) / "Saved_Passwords.txt"
-        content = "# Google Chrome - Saved Passwords (summary)\n"
-        content += f"# User: {USER_NAME} ({USER_EMAIL})\n"
-        content += "# WARNING: FAKE credentials for sandbox analysis\n\n"
-        content += f"Total saved passwords: {len(passwords)}\n\n"
-        content += "="*70 + "\n\n"
-        for pwd in passwords:
-            content += f"Website: {pwd['url']}\n"
-            content += f"Username: {pwd['username']}\n"
-            content += f"Password: {pwd['password']}\n"
-            content += f"Created: {pwd['date_created'].strftime('%Y-%m-%d')}\n"
-            content += f"Times Used: {pwd['times_used']}\n"
-            content += "-"*70 + "\n\n"
-        summary_file.write_text(content, encoding='utf-8')
+        parts.extend(fmt["row"].format_map(pwd) for pwd in passwords)
+        write_utf8(summary_file, "".join(parts))
 
         return [creds_profile_file, summary_file]
+
+    def generate_chrome_credentials(self, output_dir, passwords=None, logins_cache=None):
+        """Generate Chrome saved passwords file"""
+        return self._write_credentials("chrome", output_dir, passwords, logins_cache)
     
-    def generate_firefox_credentials(self, output_dir):
+    def generate_firefox_credentials(self, output_dir, passwords=None, logins_cache=None):
         """Generate Firefox saved passwords file"""
-        passwords = self.generate_saved_passwords()
-        profile_dir = self.profile_paths["firefox"]
-
-        # Firefox stores JSON logins file; mimic that structure
-        creds_json = {
-            "nextId": len(passwords) + 1,
-            "logins": [
-                {
-                    "id": idx + 1,
-                    "hostname": pwd["url"],
-                    "httpRealm": None,
-                    "formSubmitURL": pwd["url"],
-                    "usernameField": "username",
-                    "passwordField": "password",
-                    "encryptedUsername": pwd["username"],
-                    "encryptedPassword": pwd["password"],
-                    "timeCreated": firefox_timestamp(pwd["date_created"]),
-                    "timePasswordChanged": firefox_timestamp(pwd["date_created"]),
-                    "timesUsed": pwd["times_used"],
-                }
-                for idx, pwd in enumerate(passwords)
-            ],
-        }
-        creds_profile_file = write_text_file(
-            Path(profile_dir) / "logins.json", json.dumps(creds_json, indent=2)
-        )
-
-        summary_file = Path(output_dir) / "Saved_Passwords_Firefox.txt"
-        content = "# Mozilla Firefox - Saved Passwords (summary)\n"
-        content += f"# User: {USER_NAME} ({USER_EMAIL})\n"
-        content += "# WARNING: FAKE credentials for sandbox analysis\n\n"
-        content += f"Total saved logins: {len(passwords)}\n\n"
-        content += "="*70 + "\n\n"
-        for pwd in passwords:
-            content += f"Site: {pwd['url']}\n"
-            content += f"Username: {pwd['username']}\n"
-            content += f"Password: {pwd['password']}\n"
-            content += f"Date Created: {pwd['date_created'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-            content += f"Used {pwd['times_used']} times\n"
-            content += "-"*70 + "\n\n"
-        summary_file.write_text(content, encoding='utf-8')
-
-        return [creds_profile_file, summary_file]
+        return self._write_credentials("firefox", output_dir, passwords, logins_cache)
     
-    def generate_edge_credentials(self, output_dir):
+    def generate_edge_credentials(self, output_dir, passwords=None, logins_cache=None):
         """Generate Edge saved passwords file"""
-        passwords = self.generate_saved_passwords()
-        profile_dir = self.profile_paths["edge"]
-
-        creds_json = [
-            {
-                "origin_url": pwd["url"],
-                "username": pwd["username"],
-                "password": pwd["password"],
-                "date_created": pwd["date_created"].isoformat(),
-                "times_used": pwd["times_used"],
-            }
-            for pwd in passwords
-        ]
-        creds_profile_file = write_text_file(
-            Path(profile_dir) / "Login Data.json",
-            json.dumps(creds_json, indent=2),
-        )
-
-        summary_file = Path(output_dir) / "Saved_Passwords_Edge.txt"
-        content = "# Microsoft Edge - Saved Passwords (summary)\n"
-        content += f"# User: {USER_NAME} ({USER_EMAIL})\n"
-        content += "# WARNING: FAKE credentials for sandbox analysis\n\n"
-        content += f"Total passwords saved: {len(passwords)}\n\n"
-        content += "="*70 + "\n\n"
-        for pwd in passwords:
-            content += f"URL: {pwd['url']}\n"
-            content += f"Username: {pwd['username']}\n"
-            content += f"Password: {pwd['password']}\n"
-            content += f"Created: {pwd['date_created'].strftime('%Y-%m-%d')}\n"
-            content += f"Usage Count: {pwd['times_used']}\n"
-            content += "-"*70 + "\n\n"
-        summary_file.write_text(content, encoding='utf-8')
-
-        return [creds_profile_file, summary_file]
+        return self._write_credentials("edge", output_dir, passwords, logins_cache)
     
-    def generate_cookies_file(self, browser_label, profile_dir, output_dir):
+    def _draw_cookies(self):
+        """Pick one (site, cookie name, description, value) per website category"""
+        cookies = []
+        for sites in COMMON_WEBSITES.values():
+            sample_site = random.choice(sites)
+            cookie_name, description = random.choice(COOKIE_TYPES)
+            value = random.randbytes(16).hex()  # 32 hex chars, one C-level call
+            cookies.append((sample_site, cookie_name, description, value))
+        return cookies
+
+    def generate_cookies_file(self, browser_label, profile_dir, output_dir, cookies=None):
         """Generate cookies information file"""
         ensure_directory(output_dir)
-
-        content = f"# {browser_label} - Cookies Information\n"
-        content += f"# User: {USER_NAME}\n"
-        content += f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        content += "Common cookies stored:\n\n"
-        
-        cookie_types = [
-            ("session_id", "Session identifier"),
-            ("auth_token", "Authentication token"),
-            ("user_prefs", "User preferences"),
-            ("tracking_id", "Analytics tracking"),
-            ("csrf_token", "CSRF protection"),
-            ("language", "Language preference"),
-            ("timezone", "Timezone setting")
+        if cookies is None:
+            cookies = self._draw_cookies()
+
+        now = datetime.now()
+        parts = [
+            f"# {browser_label} - Cookies Information\n"
+            f"# User: {USER_NAME}\n"
+            f"# Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "Common cookies stored:\n\n"
         ]
         
         cookie_profile_entries = []
-        for site_category, sites in COMMON_WEBSITES.items():
-            sample_site = random.choice(sites)
-            cookie_name, description = random.choice(cookie_types)
-            value = random_string(32)
-            expires = (datetime.now() + timedelta(days=365)).strftime('%Y-%m-%d')
-            
-            content += f"Domain: .{sample_site}\n"
-            content += f"  Cookie: {cookie_name}\n"
-            content += f"  Description: {description}\n"
-            content += f"  Value: {value}\n"
-            content += f"  Expires: {expires}\n"
-            content += f"  Secure: Yes\n"
-            content += f"  HttpOnly: Yes\n\n"
+        for sample_site, cookie_name, description, value in cookies:
+            expires = (now + timedelta(days=365)).strftime('%Y-%m-%d')
+
+            parts.append(
+                f"Domain: .{sample_site}\n"
+                f"  Cookie: {cookie_name}\n"
+                f"  Description: {description}\n"
+                f"  Value: {value}\n"
+                f"  Expires: {expires}\n"
+                "  Secure: Yes\n"
+                "  HttpOnly: Yes\n\n"
+            )
 
             cookie_profile_entries.append(
                 {
@@ -506,59 +632,102 @@ class BrowserDataGenerator:
             )
         
         cookies_info_file = Path(output_dir) / "Cookies_Info.txt"
-        cookies_info_file.write_text(content, encoding='utf-8')
+        write_utf8(cookies_info_file, "".join(parts))
 
-        cookies_profile_file = write_text_file(
-            Path(profile_dir) / "Cookies.json", json.dumps(cookie_profile_entries, indent=2)
+        ensure_directory(profile_dir)
+        cookies_profile_file = Path(profile_dir) / "Cookies.json"
+        write_utf8(
+            cookies_profile_file,
+            json.dumps(cookie_profile_entries, separators=PROFILE_JSON_SEPARATORS),
         )
         return [cookies_info_file, cookies_profile_file]
     
     def generate_all_browser_data(self):
         """Generate all browser data for Chrome, Firefox, and Edge"""
         created_files = []
+
+        # Generate one history pool and give each browser its own time-ordered
+        # subset, so profiles overlap like a real user's without being copies
+        shared_history = self.generate_browsing_history(250)
+        firefox_history = self._history_subset(shared_history, 200)
+        edge_history = self._history_subset(shared_history, 180)
+        # Saved passwords sync across browsers; Chrome and Edge also share
+        # the rendered Chromium logins JSON
+        saved_passwords = self.generate_saved_passwords()
+        logins_cache = {}
+        # Visit durations and cookies are drawn here, in the same order as a
+        # serial Chrome, Firefox, Edge run, so the worker threads below only
+        # do SQLite and file I/O and seeded runs stay reproducible
+        chrome_durations = self._draw_visit_durations(shared_history)
+        chrome_cookies = self._draw_cookies()
+        firefox_cookies = self._draw_cookies()
+        edge_durations = self._draw_visit_durations(edge_history)
+        edge_cookies = self._draw_cookies()
         
         browsers = {
             "Chrome": {
                 "profile": self.profile_paths["chrome"],
-                "history": self.generate_chrome_history,
-                "credentials": self.generate_chrome_credentials,
-                "cookies": lambda d: self.generate_cookies_file("Google Chrome", self.profile_paths["chrome"], d),
+                "history": lambda d: self.generate_chrome_history(d, shared_history, chrome_durations),
+                "credentials": lambda d: self.generate_chrome_credentials(d, saved_passwords, logins_cache),
+                "cookies": lambda d: self.generate_cookies_file("Google Chrome", self.profile_paths["chrome"], d, chrome_cookies),
             },
             "Firefox": {
                 "profile": self.profile_paths["firefox"],
-                "history": self.generate_firefox_history,
-                "credentials": self.generate_firefox_credentials,
-                "cookies": lambda d: self.generate_cookies_file("Mozilla Firefox", self.profile_paths["firefox"], d),
+                "history": lambda d: self.generate_firefox_history(d, firefox_history),
+                "credentials": lambda d: self.generate_firefox_credentials(d, saved_passwords, logins_cache),
+                "cookies": lambda d: self.generate_cookies_file("Mozilla Firefox", self.profile_paths["firefox"], d, firefox_cookies),
             },
             "Edge": {
                 "profile": self.profile_paths["edge"],
-                "history": self.generate_edge_history,
-                "credentials": self.generate_edge_credentials,
-                "cookies": lambda d: self.generate_cookies_file("Microsoft Edge", self.profile_paths["edge"], d),
+                "history": lambda d: self.generate_edge_history(d, edge_history, edge_durations),
+                "credentials": lambda d: self.generate_edge_credentials(d, saved_passwords, logins_cache),
+                "cookies": lambda d: self.generate_cookies_file("Microsoft Edge", self.profile_paths["edge"], d, edge_cookies),
             },
         }
         
         print("\n[*] Generating browser data...")
-        
-        for browser_name, generators in browsers.items():
-            browser_dir = self.base_path / "Documents" / f"Browser_Data_{browser_name}"
-            ensure_directory(browser_dir)
-            
-            print(f"\n    {browser_name}:")
-            
-            # Generate history
-            history_files = generators["history"](browser_dir)
-            created_files.extend(history_files)
-            print(f"      ✓ History stored under {generators['profile']}")
-            
-            # Generate credentials
-            creds_files = generators["credentials"](browser_dir)
-            created_files.extend(creds_files)
-            print(f"      ✓ Credentials saved ({len(creds_files)} files)")
-            
-            # Generate cookies info
-            cookies_files = generators["cookies"](browser_dir)
-            created_files.extend(cookies_files)
-            print(f"      ✓ Cookies cached ({len(cookies_files)} files)")
+
+        # Create every profile and output directory once, before any writer runs
+        for directory in {
+            *self.profile_paths.values(),
+            *(self._browser_output_dir(name) for name in browsers),
+        }:
+            ensure_directory(directory)
+
+        # Browsers write to separate profiles and DB files, so run them
+        # concurrently; progress lines are buffered and printed in order
+        with ThreadPoolExecutor(max_workers=len(browsers)) as pool:
+            futures = [
+                pool.submit(self._generate_browser_files, browser_name, generators)
+                for browser_name, generators in browsers.items()
+            ]
+            for future in futures:
+                files, log_lines = future.result()
+                created_files.extend(files)
+                print("\n".join(log_lines))
         
         return created_files
+
+    def _generate_browser_files(self, browser_name, generators):
+        """Generate history, credentials and cookies for one browser"""
+        created_files = []
+        log_lines = [f"\n    {browser_name}:"]
+
+        browser_dir = self._browser_output_dir(browser_name)
+
+        # Generate history
+        history_files = generators["history"](browser_dir)
+        created_files.extend(history_files)
+        log_lines.append(f"      ✓ History stored under {generators['profile']}")
+
+        # Generate credentials
+        creds_files = generators["credentials"](browser_dir)
+        created_files.extend(creds_files)
+        log_lines.append(f"      ✓ Credentials saved ({len(creds_files)} files)")
+
+        # Generate cookies info
+        cookies_files = generators["cookies"](browser_dir)
+        created_files.extend(cookies_files)
+        log_lines.append(f"      ✓ Cookies cached ({len(cookies_files)} files)")
+
+        return created_files, log_lines
@@ -4,24 +4,26 @@ Enhanced Document Generator
 Creates additional realistic documents for Documents and Downloads folders
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from config import USER_NAME, USER_EMAIL, COMPANY_NAME, USER_ADDRESS, USER_CITY, USER_STATE, USER_ZIP
-from utils.helpers import format_currency, ensure_directory, random_date
+from utils.helpers import format_currency, ensure_directory, random_date, random_ints, write_utf8
 
+# Config values substituted into the %-style document templates below
+TEMPLATE_FIELDS = {
+    "company_name": COMPANY_NAME,
+    "user_name": USER_NAME,
+    "user_email": USER_EMAIL,
+    "user_address": USER_ADDRESS,
+    "user_city": USER_CITY,
+    "user_state": USER_STATE,
+    "user_zip": USER_ZIP,
+}
 
-class EnhancedDocumentGenerator:
-    """Generates additional realistic documents"""
-    
-    def __init__(self, base_path):
-        self.base_path = Path(base_path)
-    
-    def generate_contract(self):
-        """Generate employment contract"""
-        
-        content = f"""EMPLOYMENT CONTRACT
+CONTRACT_TEMPLATE = """EMPLOYMENT CONTRACT
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -29,16 +31,16 @@ THIS AGREEMENT is entered into as of January 15, 2020
 
 BETWEEN:
 
-{COMPANY_NAME} Inc.
+%(company_name)s Inc.
 450 Market Street, Suite 1200
 San Francisco, CA 94111
 ("Employer")
 
 AND:
 
-{USER_NAME}
-{USER_ADDRESS}
-{USER_CITY}, {USER_STATE} {USER_ZIP}
+%(user_name)s
+%(user_address)s
+%(user_city)s, %(user_state)s %(user_zip)s
 ("Employee")
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -59,7 +61,7 @@ including but not limited to:
 2. COMPENSATION
 
 Base Salary: $115,000 per year, payable bi-weekly
-Performance Bonus: Up to 15% of base salary annually
+Performance Bonus: Up to 15%% of base salary annually
 Stock Options: 10,000 shares vesting over 4 years
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -67,7 +69,7 @@ Stock Options: 10,000 shares vesting over 4 years
 3. BENEFITS
 
 • Health insurance (medical, dental, vision)
-• 401(k) retirement plan with 4% company match
+• 401(k) retirement plan with 4%% company match
 • 15 days paid vacation per year
 • 10 days sick leave per year
 • Professional development budget: $2,000/year
@@ -98,7 +100,7 @@ Severance: 2 weeks pay per year of service (minimum 4 weeks).
 
 SIGNATURES:
 
-Employee: {USER_NAME}
+Employee: %(user_name)s
 Signature: ________________________    Date: January 15, 2020
 
 Employer: Sarah Johnson, VP Human Resources
@@ -106,24 +108,120 @@ Signature: ________________________    Date: January 15, 2020
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_performance_review(self, year):
-        """Generate performance review"""
-        
-        content = f"""ANNUAL PERFORMANCE REVIEW
-{year}
+
+INSURANCE_POLICY_TEMPLATE = """INSURANCE POLICY DOCUMENT
+Policy Number: POL-%(policy_number)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+POLICYHOLDER INFORMATION
+
+Name: %(user_name)s
+Address: %(user_address)s
+         %(user_city)s, %(user_state)s %(user_zip)s
+Email: %(user_email)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+POLICY DETAILS
+
+Policy Type: Comprehensive Health Insurance
+Insurance Company: Blue Cross Blue Shield
+Plan Name: PPO Gold Plus
+Effective Date: January 1, 2024
+Expiration Date: December 31, 2024
+Premium: $450/month
+
+═══════════════════════════════════════════════════════════════════════════
+
+COVERAGE SUMMARY
+
+Annual Deductible:
+  Individual: $1,500
+  Family: $3,000
+
+Out-of-Pocket Maximum:
+  Individual: $6,000
+  Family: $12,000
+
+Coinsurance: 80/20 (Plan pays 80%% after deductible)
+
+═══════════════════════════════════════════════════════════════════════════
+
+COVERED SERVICES
+
+Office Visits:
+  Primary Care: $25 copay
+  Specialist: $50 copay
+  
+Emergency Care:
+  Emergency Room: $500 copay (waived if admitted)
+  Urgent Care: $75 copay
+
+Hospital Services:
+  Inpatient: 20%% coinsurance after deductible
+  Outpatient Surgery: 20%% coinsurance after deductible
+
+Preventive Care: Covered 100%% (no copay or deductible)
+
+Prescription Drugs:
+  Tier 1 (Generic): $10 copay
+  Tier 2 (Preferred Brand): $40 copay
+  Tier 3 (Non-Preferred Brand): $70 copay
+
+Mental Health: Same as office visit copays
+
+═══════════════════════════════════════════════════════════════════════════
+
+PROVIDER NETWORK
+
+In-Network: Full coverage as outlined above
+Out-of-Network: 60/40 coinsurance, higher deductible applies
+
+Provider Directory: www.bcbs.com/find-a-doctor
+Customer Service: 1-800-123-4567 (24/7)
+
+═══════════════════════════════════════════════════════════════════════════
+
+EXCLUSIONS
+
+This policy does not cover:
+• Cosmetic procedures
+• Experimental treatments
+• Services not medically necessary
+• Services provided by non-licensed practitioners
+
+═══════════════════════════════════════════════════════════════════════════
+
+IMPORTANT NOTICES
+
+• ID cards will arrive within 10 business days
+• For emergencies, call 911 or go to nearest ER
+• Pre-authorization required for some services
+• Claims must be filed within 12 months
+
+═══════════════════════════════════════════════════════════════════════════
+
+For questions or to file a claim:
+Phone: 1-800-123-4567
+Website: www.bcbs.com
+Email: customerservice@bcbs.com
+
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+PERFORMANCE_REVIEW_TEMPLATE = """ANNUAL PERFORMANCE REVIEW
+%(year)d
 
 ═══════════════════════════════════════════════════════════════════════════
 
 EMPLOYEE INFORMATION
 
-Name: {USER_NAME}
+Name: %(user_name)s
 Position: Senior Software Engineer
 Department: Engineering
-Review Period: January 1, {year} - December 31, {year}
-Review Date: January 15, {year + 1}
+Review Period: January 1, %(year)d - December 31, %(year)d
+Review Date: January 15, %(next_year)d
 Manager: Mike Chen, Engineering Manager
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -153,7 +251,7 @@ KEY ACCOMPLISHMENTS
    and team capabilities.
 
 3. Implemented performance optimizations that reduced API response time
-   by 40%, significantly improving user experience.
+   by 40%%, significantly improving user experience.
 
 4. Contributed to open-source projects that enhanced company's technical
    reputation in the developer community.
@@ -173,7 +271,7 @@ AREAS FOR DEVELOPMENT
 
 ═══════════════════════════════════════════════════════════════════════════
 
-GOALS FOR {year + 1}
+GOALS FOR %(next_year)d
 
 1. Lead 2 major technical initiatives from conception to production
 
@@ -189,12 +287,12 @@ GOALS FOR {year + 1}
 
 COMPENSATION ADJUSTMENT
 
-Current Base Salary: ${95000 + (year - 2022) * 5000}
-New Base Salary: ${100000 + (year - 2022) * 5000}
-Increase: 5.3%
-Effective Date: January 1, {year + 1}
+Current Base Salary: $%(current_salary)d
+New Base Salary: $%(new_salary)d
+Increase: 5.3%%
+Effective Date: January 1, %(next_year)d
 
-Performance Bonus: {format_currency(random.randint(8000, 15000))}
+Performance Bonus: %(bonus)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -209,7 +307,7 @@ and sharing knowledge more effectively across the organization.
 
 SIGNATURES
 
-Employee: {USER_NAME}
+Employee: %(user_name)s
 Signature: ________________________    Date: _______________
 
 Manager: Mike Chen
@@ -220,37 +318,35 @@ Signature: ________________________    Date: _______________
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_training_certificate(self):
-        """Generate training certificate"""
-        
-        courses = [
-            "AWS Solutions Architect Professional",
-            "Kubernetes Administration",
-            "Advanced Python Programming",
-            "Microservices Architecture Patterns",
-            "Security Best Practices for Developers"
-        ]
-        
-        course = random.choice(courses)
-        completion_date = datetime.now() - timedelta(days=random.randint(30, 365))
-        
-        content = f"""CERTIFICATE OF COMPLETION
+
+TRAINING_COURSES = [
+    "AWS Solutions Architect Professional",
+    "Kubernetes Administration",
+    "Advanced Python Programming",
+    "Microservices Architecture Patterns",
+    "Security Best Practices for Developers"
+]
+
+CERTIFICATE_HOURS = [8, 16, 24, 40]
+
+# Size of the joint space a certificate's random fields are drawn from:
+# course x hours x 30-365 days ago x score 85-98 x ID 100000-999999
+CERTIFICATE_DRAW_SPACE = len(TRAINING_COURSES) * len(CERTIFICATE_HOURS) * 336 * 14 * 900000
+
+CERTIFICATE_TEMPLATE = """CERTIFICATE OF COMPLETION
 
 ═══════════════════════════════════════════════════════════════════════════
 
 This is to certify that
 
-{USER_NAME}
+%(user_name)s
 
 has successfully completed the course
 
-{course}
+%(course)s
 
-Date of Completion: {completion_date.strftime('%B %d, %Y')}
-Duration: {random.choice([8, 16, 24, 40])} hours
+Date of Completion: %(completion_date)s
+Duration: %(hours)d hours
 Provider: TechAcademy Online Learning
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -260,11 +356,11 @@ COURSE OBJECTIVES MET:
 ✓ Understand core concepts and principles
 ✓ Apply knowledge to real-world scenarios
 ✓ Demonstrate proficiency through hands-on projects
-✓ Pass final assessment with score of {random.randint(85, 98)}%
+✓ Pass final assessment with score of %(score)d%%
 
 ═══════════════════════════════════════════════════════════════════════════
 
-Certificate ID: CERT-{random.randint(100000, 999999)}
+Certificate ID: CERT-%(cert_id)d
 Verify at: www.techacademy.com/verify
 
 Instructor: Dr. Robert Anderson
@@ -272,114 +368,91 @@ Academic Director
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_insurance_policy(self):
-        """Generate insurance policy document"""
-        
-        content = f"""INSURANCE POLICY DOCUMENT
-Policy Number: POL-{random.randint(100000000, 999999999)}
-
-═══════════════════════════════════════════════════════════════════════════
-
-POLICYHOLDER INFORMATION
-
-Name: {USER_NAME}
-Address: {USER_ADDRESS}
-         {USER_CITY}, {USER_STATE} {USER_ZIP}
-Email: {USER_EMAIL}
-
-═══════════════════════════════════════════════════════════════════════════
-
-POLICY DETAILS
-
-Policy Type: Comprehensive Health Insurance
-Insurance Company: Blue Cross Blue Shield
-Plan Name: PPO Gold Plus
-Effective Date: January 1, 2024
-Expiration Date: December 31, 2024
-Premium: $450/month
-
-═══════════════════════════════════════════════════════════════════════════
-
-COVERAGE SUMMARY
-
-Annual Deductible:
-  Individual: $1,500
-  Family: $3,000
-
-Out-of-Pocket Maximum:
-  Individual: $6,000
-  Family: $12,000
-
-Coinsurance: 80/20 (Plan pays 80% after deductible)
-
-═══════════════════════════════════════════════════════════════════════════
-
-COVERED SERVICES
-
-Office Visits:
-  Primary Care: $25 copay
-  Specialist: $50 copay
-  
-Emergency Care:
-  Emergency Room: $500 copay (waived if admitted)
-  Urgent Care: $75 copay
-
-Hospital Services:
-  Inpatient: 20% coinsurance after deductible
-  Outpatient Surgery: 20% coinsurance after deductible
-
-Preventive Care: Covered 100% (no copay or deductible)
-
-Prescription Drugs:
-  Tier 1 (Generic): $10 copay
-  Tier 2 (Preferred Brand): $40 copay
-  Tier 3 (Non-Preferred Brand): $70 copay
-
-Mental Health: Same as office visit copays
 
-═══════════════════════════════════════════════════════════════════════════
+# The contract depends only on config, so it is rendered once at import
+CONTRACT_TEXT = CONTRACT_TEMPLATE % TEMPLATE_FIELDS
 
-PROVIDER NETWORK
+# The policy number is the insurance document's only per-call field: render
+# everything else once and keep the text either side of it
+INSURANCE_POLICY_PARTS = tuple(
+    (INSURANCE_POLICY_TEMPLATE % dict(TEMPLATE_FIELDS, policy_number="\0")).split("\0")
+)
 
-In-Network: Full coverage as outlined above
-Out-of-Network: 60/40 coinsurance, higher deductible applies
 
-Provider Directory: www.bcbs.com/find-a-doctor
-Customer Service: 1-800-123-4567 (24/7)
+def _review_salaries(year):
+    """(current, new) base salary quoted in the review for `year`"""
+    return 95000 + (year - 2022) * 5000, 100000 + (year - 2022) * 5000
 
-═══════════════════════════════════════════════════════════════════════════
 
-EXCLUSIONS
+def _write_document(path_and_content):
+    """Write one (path, text) pair; used as a thread-pool task"""
+    path, content = path_and_content
+    write_utf8(path, content)
 
-This policy does not cover:
-• Cosmetic procedures
-• Experimental treatments
-• Services not medically necessary
-• Services provided by non-licensed practitioners
-
-═══════════════════════════════════════════════════════════════════════════
 
-IMPORTANT NOTICES
-
-• ID cards will arrive within 10 business days
-• For emergencies, call 911 or go to nearest ER
-• Pre-authorization required for some services
-• Claims must be filed within 12 months
-
-═══════════════════════════════════════════════════════════════════════════
-
-For questions or to file a claim:
-Phone: 1-800-123-4567
-Website: www.bcbs.com
-Email: customerservice@bcbs.com
+class EnhancedDocumentGenerator:
+    """Generates additional realistic documents"""
+    
+    def __init__(self, base_path):
+        self.base_path = Path(base_path)
+        documents_folder = self.base_path / "Documents"
+        self.contracts_folder = documents_folder / "Contracts"
+        self.perf_folder = documents_folder / "Work" / "Performance_Reviews"
+        self.training_folder = documents_folder / "Work" / "Training_Materials"
+        self.insurance_folder = documents_folder / "Personal" / "Insurance"
+    
+    def generate_contract(self):
+        """Generate employment contract"""
+        return CONTRACT_TEXT
+    
+    def generate_performance_reviews(self, years):
+        """Generate one performance review per year, drawing all bonuses at once"""
+        reviews = []
+        for year, bonus in zip(years, random_ints(8000, 15000, len(years))):
+            current_salary, new_salary = _review_salaries(year)
+            reviews.append(PERFORMANCE_REVIEW_TEMPLATE % dict(
+                TEMPLATE_FIELDS,
+                year=year,
+                next_year=year + 1,
+                current_salary=current_salary,
+                new_salary=new_salary,
+                bonus=format_currency(bonus),
+            ))
+        return reviews
+    
+    def generate_performance_review(self, year):
+        """Generate performance review"""
+        return self.generate_performance_reviews([year])[0]
+    
+    def generate_training_certificates(self, count):
+        """Generate `count` training certificates, one random draw each"""
+        now = datetime.now()
+        certificates = []
+        for _ in range(count):
+            # Decode course, age, hours, score and ID from one uniform draw
+            # over the product of their ranges
+            n = random.randrange(CERTIFICATE_DRAW_SPACE)
+            n, course = divmod(n, len(TRAINING_COURSES))
+            n, hours = divmod(n, len(CERTIFICATE_HOURS))
+            n, days_ago = divmod(n, 336)
+            cert_id, score = divmod(n, 14)
+            certificates.append(CERTIFICATE_TEMPLATE % dict(
+                TEMPLATE_FIELDS,
+                course=TRAINING_COURSES[course],
+                completion_date=(now - timedelta(days=30 + days_ago)).strftime('%B %d, %Y'),
+                hours=CERTIFICATE_HOURS[hours],
+                score=85 + score,
+                cert_id=100000 + cert_id,
+            ))
+        return certificates
 
-═══════════════════════════════════════════════════════════════════════════
-"""
-        
-        return content
+    def generate_training_certificate(self):
+        """Generate training certificate"""
+        return self.generate_training_certificates(1)[0]
+    
+    def generate_insurance_policy(self):
+        """Generate insurance policy document"""
+        return str(random.randint(100000000, 999999999)).join(INSURANCE_POLICY_PARTS)
     
     def generate_all_enhanced_documents(self):
         """Generate all enhanced documents"""
@@ -387,46 +460,41 @@ Email: customerservice@bcbs.com
         
         print("\n[*] Generating enhanced documents...")
         
-        documents_folder = self.base_path / "Documents"
-        ensure_directory(documents_folder)
-        
-        # Contracts folder
-        contracts_folder = documents_folder / "Contracts"
-        ensure_directory(contracts_folder)
-        
-        contract = self.generate_contract()
-        contract_file = contracts_folder / "Employment_Contract_2020.txt"
-        contract_file.write_text(contract, encoding='utf-8')
-        created_files.append(contract_file)
+        contracts_folder = self.contracts_folder
+        perf_folder = self.perf_folder
+        training_folder = self.training_folder
+        insurance_folder = self.insurance_folder
+
+        # Only the leaves need creating; mkdir(parents=True) makes the rest
+        for folder in (contracts_folder, perf_folder, training_folder, insurance_folder):
+            ensure_directory(folder)
+
+        # Build every document first, then overlap the small file writes
+        files_and_content = [
+            (contracts_folder / "Employment_Contract_2020.txt", self.generate_contract()),
+        ]
         
         # Performance reviews
-        perf_folder = documents_folder / "Work" / "Performance_Reviews"
-        ensure_directory(perf_folder)
-        
-        for year in [2022, 2023, 2024]:
-            review = self.generate_performance_review(year)
-            review_file = perf_folder / f"Performance_Review_{year}.txt"
-            review_file.write_text(review, encoding='utf-8')
-            created_files.append(review_file)
+        review_years = [2022, 2023, 2024]
+        for year, review in zip(review_years, self.generate_performance_reviews(review_years)):
+            files_and_content.append(
+                (perf_folder / f"Performance_Review_{year}.txt", review)
+            )
         
         # Training certificates
-        training_folder = documents_folder / "Work" / "Training_Materials"
-        ensure_directory(training_folder)
-        
-        for i in range(3):
-            cert = self.generate_training_certificate()
-            cert_file = training_folder / f"Training_Certificate_{i+1}.txt"
-            cert_file.write_text(cert, encoding='utf-8')
-            created_files.append(cert_file)
+        for i, certificate in enumerate(self.generate_training_certificates(3)):
+            files_and_content.append(
+                (training_folder / f"Training_Certificate_{i+1}.txt", certificate)
+            )
         
         # Insurance
-        insurance_folder = documents_folder / "Personal" / "Insurance"
-        ensure_directory(insurance_folder)
-        
-        insurance = self.generate_insurance_policy()
-        insurance_file = insurance_folder / "Health_Insurance_Policy_2024.txt"
-        insurance_file.write_text(insurance, encoding='utf-8')
-        created_files.append(insurance_file)
+        files_and_content.append(
+            (insurance_folder / "Health_Insurance_Policy_2024.txt", self.generate_insurance_policy())
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_write_document, files_and_content))
+        created_files.extend(path for path, _ in files_and_content)
         
         print(f"    ✓ Generated {len(created_files)} enhanced documents")
         
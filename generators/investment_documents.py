@@ -4,8 +4,11 @@ Investment Document Generator
 Creates realistic investment statements with stocks, bonds, and ETFs
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import random
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from config import (
@@ -16,9 +19,153 @@ from utils.helpers import (
     format_currency,
     ensure_directory,
     random_date,
+    random_ints,
     create_workbook,
 )
 
+# Fixed text of the annual statement; only the %-fields vary per year
+STATEMENT_HEADER_TEMPLATE = """ANNUAL INVESTMENT STATEMENT
+Year: %(year)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+ACCOUNT INFORMATION
+
+Account Holder: %(user_name)s
+Account Number: ****-****-5827
+Account Type: Individual Brokerage Account
+Statement Period: January 1, %(year)s - December 31, %(year)s
+
+Brokerage Firm: Fidelity Investments
+Address: 245 Summer Street, Boston, MA 02210
+Phone: 1-800-343-3548
+
+═══════════════════════════════════════════════════════════════════════════
+
+ACCOUNT SUMMARY
+
+Beginning Balance (Jan 1, %(year)s):              %(beginning_balance)s
+Deposits & Contributions:                       %(deposits)s
+Withdrawals & Distributions:                    %(withdrawals)s
+Net Investment Gain/Loss:                       %(net_gain)s
+
+Ending Balance (Dec 31, %(year)s):                %(ending_balance)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+STOCK TRANSACTIONS
+
+Date         Type    Symbol   Shares    Price      Commission   Total
+───────────────────────────────────────────────────────────────────────────
+"""
+
+ETF_SECTION_HEADER = """
+═══════════════════════════════════════════════════════════════════════════
+
+ETF TRANSACTIONS
+
+Date         Type    Symbol   Shares    Price      Commission   Total
+───────────────────────────────────────────────────────────────────────────
+"""
+
+BOND_SECTION_HEADER = """
+═══════════════════════════════════════════════════════════════════════════
+
+BOND TRANSACTIONS
+
+Date         Type    Bond Name                 Units   Price    Total
+───────────────────────────────────────────────────────────────────────────
+"""
+
+HOLDINGS_HEADER_TEMPLATE = """
+═══════════════════════════════════════════════════════════════════════════
+
+CURRENT HOLDINGS (as of December 31, %(year)s)
+
+STOCKS:
+"""
+
+TAX_INFO_TEMPLATE = """
+═══════════════════════════════════════════════════════════════════════════
+
+YEAR-END TAX INFORMATION
+
+Total Dividends Received:                       %(dividends)s
+Total Interest Received:                        %(interest)s
+Short-term Capital Gains:                       %(short_term_gains)s
+Long-term Capital Gains:                        %(long_term_gains)s
+
+Form 1099-DIV and 1099-INT will be mailed by January 31, %(next_year)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+"""
+
+STATEMENT_FOOTER = """IMPORTANT INFORMATION
+
+This statement is provided for informational purposes. Please review carefully
+and contact us immediately if you have any questions or notice any discrepancies.
+
+For customer service: 1-800-343-3548
+Online access: www.fidelity.com
+
+Thank you for choosing Fidelity Investments.
+
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+# Share lot sizes traded per stock / ETF transaction
+STOCK_SHARE_LOTS = [5, 10, 15, 20, 25, 50, 100]
+ETF_SHARE_LOTS = [10, 20, 30, 50, 100]
+
+# Bond face values and unit counts per bond purchase
+BOND_FACE_VALUES = [1000, 5000, 10000]
+BOND_UNIT_COUNTS = [1, 5, 10]
+
+# Standard deviation of a holding's year-end price around its last trade
+YEAR_END_PRICE_DRIFT = 0.05
+
+# Whether a bought stock is also sold during the year (40% chance)
+SELL_FLAGS = [False, True]
+SELL_FLAG_WEIGHTS = [60, 40]
+
+# One line of the stock / ETF transaction tables in the annual statement,
+# filled straight from a transaction dict with format_map
+SECURITY_ROW_FORMAT = (
+    "{date_str}   {type:4}   {symbol:6}   {shares:4}    "
+    "${price:7.2f}    ${commission:5.2f}    {total_fmt:>12}\n"
+)
+
+# One line of the bond transaction table
+BOND_ROW_FORMAT = "{date_str}   {type:4}   {bond:25} {units:4}   {price:6.2f}   {total_fmt:>12}\n"
+
+
+@lru_cache(maxsize=None)
+def _year_bounds(year):
+    """(Jan 1, Dec 31) of `year`; shared by every transaction in that year"""
+    return datetime(year, 1, 1), datetime(year, 12, 31)
+
+
+def _price_spans(holdings, price_ranges, default_range):
+    """Map each holding to (low, high - low) of its price range"""
+    spans = {}
+    for holding in holdings:
+        low, high = price_ranges.get(holding, default_range)
+        spans[holding] = (low, high - low)
+    return spans
+
+
+def _year_end_price(last_trade_price):
+    """Year-end price for a holding: its latest trade price with ~5% drift"""
+    return round(last_trade_price * (1 + random.gauss(0, YEAR_END_PRICE_DRIFT)), 2)
+
+
+def _random_dates_in_year(year, count):
+    """`count` dates drawn as random_date(Jan 1, Dec 31) would, in one call"""
+    start_date, end_date = _year_bounds(year)
+    days_between = (end_date - start_date).days
+    return [start_date + timedelta(days=d) for d in random_ints(0, days_between - 1, count)]
+
 
 class InvestmentDocumentGenerator:
     """Generates realistic investment statements"""
@@ -47,16 +194,21 @@ class InvestmentDocumentGenerator:
             "Corporate Bond AAA": (98, 103), "Municipal Bond CA": (99, 104),
             "TIPS 2030": (96, 101)
         }
+        
+        # (low, high - low) per tradable holding, with the default ranges for
+        # symbols missing above already applied, for the batched builders
+        self._stock_price_spans = _price_spans(STOCK_HOLDINGS, self.stock_prices, (50, 200))
+        self._etf_price_spans = _price_spans(ETF_HOLDINGS, self.etf_prices, (100, 300))
+        self._bond_price_spans = _price_spans(BOND_HOLDINGS, self.bond_prices, (95, 105))
     
     def generate_stock_transaction(self, symbol, year, transaction_type="buy"):
         """Generate a realistic stock transaction"""
         price_range = self.stock_prices.get(symbol, (50, 200))
         price = round(random.uniform(price_range[0], price_range[1]), 2)
-        shares = random.choice([5, 10, 15, 20, 25, 50, 100])
+        shares = random.choice(STOCK_SHARE_LOTS)
         
         # Generate date within the year
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31)
+        start_date, end_date = _year_bounds(year)
         trans_date = random_date(start_date, end_date)
         
         total = round(price * shares, 2)
@@ -76,10 +228,9 @@ class InvestmentDocumentGenerator:
         """Generate an ETF transaction"""
         price_range = self.etf_prices.get(symbol, (100, 300))
         price = round(random.uniform(price_range[0], price_range[1]), 2)
-        shares = random.choice([10, 20, 30, 50, 100])
+        shares = random.choice(ETF_SHARE_LOTS)
         
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31)
+        start_date, end_date = _year_bounds(year)
         trans_date = random_date(start_date, end_date)
         
         total = round(price * shares, 2)
@@ -98,11 +249,10 @@ class InvestmentDocumentGenerator:
         """Generate a bond transaction"""
         price_range = self.bond_prices.get(bond_name, (95, 105))
         price = round(random.uniform(price_range[0], price_range[1]), 2)
-        face_value = random.choice([1000, 5000, 10000])
-        units = random.choice([1, 5, 10])
+        face_value = random.choice(BOND_FACE_VALUES)
+        units = random.choice(BOND_UNIT_COUNTS)
         
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31)
+        start_date, end_date = _year_bounds(year)
         trans_date = random_date(start_date, end_date)
         
         total = round((price / 100) * face_value * units, 2)
@@ -117,14 +267,59 @@ class InvestmentDocumentGenerator:
             "total": total
         }
     
+    def _security_transactions(self, legs, price_spans, share_lots, dates):
+        """
+        Generate stock or ETF transactions for a list of (symbol, type) legs
+        on the given dates, drawing the section's share lots in one call.
+        """
+        share_counts = random.choices(share_lots, k=len(legs))
+        
+        transactions = []
+        for (symbol, transaction_type), shares, trans_date in zip(legs, share_counts, dates):
+            # Same arithmetic as random.uniform(low, high), minus the call
+            low, span = price_spans[symbol]
+            price = round(low + span * random.random(), 2)
+            total = round(price * shares, 2)
+            transactions.append({
+                "date": trans_date,
+                "type": transaction_type,
+                "symbol": symbol,
+                "shares": shares,
+                "price": price,
+                "commission": 0,  # Most brokers are commission-free now
+                "total": total,
+                # Display forms used by the statement rows and workbook
+                "date_str": trans_date.strftime("%m/%d/%Y"),
+                "total_fmt": format_currency(total),
+            })
+        return transactions
+    
+    def _bond_transactions(self, bond_names, dates):
+        """Generate one BUY transaction per bond on the given dates"""
+        face_values = random.choices(BOND_FACE_VALUES, k=len(bond_names))
+        unit_counts = random.choices(BOND_UNIT_COUNTS, k=len(bond_names))
+        
+        transactions = []
+        for bond_name, trans_date, face_value, units in zip(bond_names, dates, face_values, unit_counts):
+            low, span = self._bond_price_spans[bond_name]
+            price = round(low + span * random.random(), 2)
+            total = round((price / 100) * face_value * units, 2)
+            transactions.append({
+                "date": trans_date,
+                "type": "BUY",
+                "bond": bond_name,
+                "face_value": face_value,
+                "units": units,
+                "price": price,
+                "total": total,
+                "date_str": trans_date.strftime("%m/%d/%Y"),
+                "total_fmt": format_currency(total),
+            })
+        return transactions
+    
     def generate_annual_statement(self, year):
         """Generate complete annual investment statement and return text plus transactions"""
         
-        # Generate transactions
-        stock_transactions = []
-        etf_transactions = []
-        bond_transactions = []
-        
         # Randomly select securities to trade
         num_stocks = random.randint(5, 10)
         num_etfs = random.randint(3, 6)
@@ -134,18 +329,26 @@ class InvestmentDocumentGenerator:
         selected_etfs = random.sample(ETF_HOLDINGS, num_etfs)
         selected_bonds = random.sample(BOND_HOLDINGS, num_bonds)
         
-        # Generate buy transactions
-        for stock in selected_stocks:
-            stock_transactions.append(self.generate_stock_transaction(stock, year, "BUY"))
-            # Some stocks have sells too
-            if random.random() > 0.6:
-                stock_transactions.append(self.generate_stock_transaction(stock, year, "SELL"))
-        
-        for etf in selected_etfs:
-            etf_transactions.append(self.generate_etf_transaction(etf, year, "BUY"))
-        
-        for bond in selected_bonds:
-            bond_transactions.append(self.generate_bond_transaction(bond, year, "BUY"))
+        # Every selected stock is bought; about 40% are sold too
+        stock_legs = []
+        for stock, sold in zip(selected_stocks, random.choices(SELL_FLAGS, SELL_FLAG_WEIGHTS, k=num_stocks)):
+            stock_legs.append((stock, "BUY"))
+            if sold:
+                stock_legs.append((stock, "SELL"))
+        
+        # Draw every transaction date for the year at once, then generate
+        # each section's transactions as one batch
+        num_stock_trades = len(stock_legs)
+        dates = _random_dates_in_year(year, num_stock_trades + num_etfs + num_bonds)
+        stock_transactions = self._security_transactions(
+            stock_legs, self._stock_price_spans, STOCK_SHARE_LOTS,
+            dates[:num_stock_trades]
+        )
+        etf_transactions = self._security_transactions(
+            [(etf, "BUY") for etf in selected_etfs], self._etf_price_spans, ETF_SHARE_LOTS,
+            dates[num_stock_trades:num_stock_trades + num_etfs]
+        )
+        bond_transactions = self._bond_transactions(selected_bonds, dates[num_stock_trades + num_etfs:])
         
         # Sort all transactions by date
         stock_transactions.sort(key=lambda x: x["date"])
@@ -153,157 +356,109 @@ class InvestmentDocumentGenerator:
         bond_transactions.sort(key=lambda x: x["date"])
         
         # Calculate totals
-        total_invested = sum(t["total"] for t in stock_transactions + etf_transactions + bond_transactions if t["type"] == "BUY")
-        total_proceeds = sum(t["total"] for t in stock_transactions if t["type"] == "SELL")
+        # One pass over the stock trades for buy/sell totals and net shares
+        stock_buys_total = stock_sells_total = 0
+        stock_shares_owned = Counter()
+        last_price = {}
+        for t in stock_transactions:
+            # Trades are in date order, so this ends on each symbol's latest price
+            last_price[t["symbol"]] = t["price"]
+            if t["type"] == "BUY":
+                stock_buys_total += t["total"]
+                stock_shares_owned[t["symbol"]] += t["shares"]
+            else:
+                stock_sells_total += t["total"]
+                stock_shares_owned[t["symbol"]] -= t["shares"]
+        
+        # ETFs and bonds are only ever bought, so carry the stock buy total
+        # on through them instead of concatenating and re-filtering the lists
+        total_invested = stock_buys_total
+        etf_purchases = bond_purchases = 0
+        for t in etf_transactions:
+            total_invested += t["total"]
+            etf_purchases += t["total"]
+        for t in bond_transactions:
+            total_invested += t["total"]
+            bond_purchases += t["total"]
+        total_proceeds = stock_sells_total
         
         # Calculate portfolio value at year end
         portfolio_value = total_invested - total_proceeds + random.randint(5000, 25000)
         
-        content = f"""ANNUAL INVESTMENT STATEMENT
-Year: {year}
-
-═══════════════════════════════════════════════════════════════════════════
-
-ACCOUNT INFORMATION
-
-Account Holder: {USER_NAME}
-Account Number: ****-****-5827
-Account Type: Individual Brokerage Account
-Statement Period: January 1, {year} - December 31, {year}
-
-Brokerage Firm: Fidelity Investments
-Address: 245 Summer Street, Boston, MA 02210
-Phone: 1-800-343-3548
-
-═══════════════════════════════════════════════════════════════════════════
-
-ACCOUNT SUMMARY
-
-Beginning Balance (Jan 1, {year}):              {format_currency(portfolio_value - (total_invested - total_proceeds))}
-Deposits & Contributions:                       {format_currency(total_invested)}
-Withdrawals & Distributions:                    {format_currency(total_proceeds)}
-Net Investment Gain/Loss:                       {format_currency(random.randint(2000, 15000))}
-
-Ending Balance (Dec 31, {year}):                {format_currency(portfolio_value)}
-
-═══════════════════════════════════════════════════════════════════════════
-
-STOCK TRANSACTIONS
-
-Date         Type    Symbol   Shares    Price      Commission   Total
-───────────────────────────────────────────────────────────────────────────
-"""
+        parts = [STATEMENT_HEADER_TEMPLATE % {
+            "year": year,
+            "user_name": USER_NAME,
+            "beginning_balance": format_currency(portfolio_value - (total_invested - total_proceeds)),
+            "deposits": format_currency(total_invested),
+            "withdrawals": format_currency(total_proceeds),
+            "net_gain": format_currency(random.randint(2000, 15000)),
+            "ending_balance": format_currency(portfolio_value),
+        }]
         
-        for trans in stock_transactions:
-            content += f"{trans['date'].strftime('%m/%d/%Y')}   {trans['type']:4}   "
-            content += f"{trans['symbol']:6}   {trans['shares']:4}    "
-            content += f"${trans['price']:7.2f}    ${trans['commission']:5.2f}    "
-            content += f"{format_currency(trans['total']):>12}\n"
+        parts.extend(SECURITY_ROW_FORMAT.format_map(trans) for trans in stock_transactions)
         
-        content += "\n"
-        content += f"Total Stock Purchases:                          {format_currency(sum(t['total'] for t in stock_transactions if t['type'] == 'BUY'))}\n"
-        content += f"Total Stock Sales:                              {format_currency(sum(t['total'] for t in stock_transactions if t['type'] == 'SELL'))}\n"
+        parts.append("\n")
+        parts.append(f"Total Stock Purchases:                          {format_currency(stock_buys_total)}\n")
+        parts.append(f"Total Stock Sales:                              {format_currency(stock_sells_total)}\n")
         
-        content += f"""
-═══════════════════════════════════════════════════════════════════════════
-
-ETF TRANSACTIONS
-
-Date         Type    Symbol   Shares    Price      Commission   Total
-───────────────────────────────────────────────────────────────────────────
-"""
+        parts.append(ETF_SECTION_HEADER)
         
-        for trans in etf_transactions:
-            content += f"{trans['date'].strftime('%m/%d/%Y')}   {trans['type']:4}   "
-            content += f"{trans['symbol']:6}   {trans['shares']:4}    "
-            content += f"${trans['price']:7.2f}    ${trans['commission']:5.2f}    "
-            content += f"{format_currency(trans['total']):>12}\n"
+        parts.extend(SECURITY_ROW_FORMAT.format_map(trans) for trans in etf_transactions)
         
-        content += "\n"
-        content += f"Total ETF Purchases:                            {format_currency(sum(t['total'] for t in etf_transactions))}\n"
+        parts.append("\n")
+        parts.append(f"Total ETF Purchases:                            {format_currency(etf_purchases)}\n")
         
-        content += f"""
-═══════════════════════════════════════════════════════════════════════════
-
-BOND TRANSACTIONS
-
-Date         Type    Bond Name                 Units   Price    Total
-───────────────────────────────────────────────────────────────────────────
-"""
+        parts.append(BOND_SECTION_HEADER)
         
-        for trans in bond_transactions:
-            content += f"{trans['date'].strftime('%m/%d/%Y')}   {trans['type']:4}   "
-            content += f"{trans['bond']:25} {trans['units']:4}   "
-            content += f"{trans['price']:6.2f}   {format_currency(trans['total']):>12}\n"
+        parts.extend(BOND_ROW_FORMAT.format_map(trans) for trans in bond_transactions)
         
-        content += "\n"
-        content += f"Total Bond Purchases:                           {format_currency(sum(t['total'] for t in bond_transactions))}\n"
+        parts.append("\n")
+        parts.append(f"Total Bond Purchases:                           {format_currency(bond_purchases)}\n")
         
-        content += f"""
-═══════════════════════════════════════════════════════════════════════════
-
-CURRENT HOLDINGS (as of December 31, {year})
-
-STOCKS:
-"""
+        parts.append(HOLDINGS_HEADER_TEMPLATE % {"year": year})
         
         # Show current stock holdings
         for stock in selected_stocks:
-            # Use default price range if stock not in dictionary
-            price_range = self.stock_prices.get(stock, (50, 200))
-            current_price = round(random.uniform(price_range[0], price_range[1]), 2)
-            shares_owned = sum(t["shares"] for t in stock_transactions if t["symbol"] == stock and t["type"] == "BUY")
-            shares_owned -= sum(t["shares"] for t in stock_transactions if t["symbol"] == stock and t["type"] == "SELL")
+            current_price = _year_end_price(last_price[stock])
+            shares_owned = stock_shares_owned[stock]
             
             if shares_owned > 0:
                 market_value = shares_owned * current_price
-                content += f"  {stock:6}  {shares_owned:4} shares @ ${current_price:7.2f}  =  {format_currency(market_value)}\n"
+                parts.append(f"  {stock:6}  {shares_owned:4} shares @ ${current_price:7.2f}  =  {format_currency(market_value)}\n")
         
-        content += "\nETFs:\n"
+        parts.append("\nETFs:\n")
+        
+        etf_shares_owned = Counter()
+        for t in etf_transactions:
+            last_price[t["symbol"]] = t["price"]
+            etf_shares_owned[t["symbol"]] += t["shares"]
         
         for etf in selected_etfs:
-            # Use default price range if ETF not in dictionary
-            price_range = self.etf_prices.get(etf, (100, 300))
-            current_price = round(random.uniform(price_range[0], price_range[1]), 2)
-            shares_owned = sum(t["shares"] for t in etf_transactions if t["symbol"] == etf)
+            current_price = _year_end_price(last_price[etf])
+            shares_owned = etf_shares_owned[etf]
             market_value = shares_owned * current_price
-            content += f"  {etf:6}  {shares_owned:4} shares @ ${current_price:7.2f}  =  {format_currency(market_value)}\n"
-        
-        content += "\nBONDS:\n"
+            parts.append(f"  {etf:6}  {shares_owned:4} shares @ ${current_price:7.2f}  =  {format_currency(market_value)}\n")
         
-        for bond in selected_bonds:
-            trans = [t for t in bond_transactions if t["bond"] == bond]
-            if trans:
-                total_value = sum(t["total"] for t in trans)
-                content += f"  {bond:30}  {format_currency(total_value)}\n"
+        parts.append("\nBONDS:\n")
         
-        content += f"""
-═══════════════════════════════════════════════════════════════════════════
-
-YEAR-END TAX INFORMATION
-
-Total Dividends Received:                       {format_currency(random.randint(500, 2500))}
-Total Interest Received:                        {format_currency(random.randint(200, 800))}
-Short-term Capital Gains:                       {format_currency(random.randint(0, 3000))}
-Long-term Capital Gains:                        {format_currency(random.randint(1000, 8000))}
-
-Form 1099-DIV and 1099-INT will be mailed by January 31, {year + 1}
-
-═══════════════════════════════════════════════════════════════════════════
-
-IMPORTANT INFORMATION
-
-This statement is provided for informational purposes. Please review carefully
-and contact us immediately if you have any questions or notice any discrepancies.
-
-For customer service: 1-800-343-3548
-Online access: www.fidelity.com
-
-Thank you for choosing Fidelity Investments.
-
-═══════════════════════════════════════════════════════════════════════════
-"""
+        bond_values = Counter()
+        for t in bond_transactions:
+            bond_values[t["bond"]] += t["total"]
         
+        for bond in selected_bonds:
+            if bond in bond_values:
+                parts.append(f"  {bond:30}  {format_currency(bond_values[bond])}\n")
+        
+        parts.append(TAX_INFO_TEMPLATE % {
+            "dividends": format_currency(random.randint(500, 2500)),
+            "interest": format_currency(random.randint(200, 800)),
+            "short_term_gains": format_currency(random.randint(0, 3000)),
+            "long_term_gains": format_currency(random.randint(1000, 8000)),
+            "next_year": year + 1,
+        })
+        parts.append(STATEMENT_FOOTER)
+        
+        content = "".join(parts)
         return content, stock_transactions, etf_transactions, bond_transactions, portfolio_value, total_invested, total_proceeds
     
     def generate_all_investment_documents(self):
@@ -315,6 +470,8 @@ Thank you for choosing Fidelity Investments.
         investments_folder = self.base_path / "Desktop" / "Investments"
         ensure_directory(investments_folder)
         
+        statement_files = []
+        workbook_sheets = []
         for year in TAX_YEARS:
             (
                 statement_content,
@@ -341,7 +498,7 @@ Thank you for choosing Fidelity Investments.
             for tx in stock_transactions:
                 tx_rows.append(
                     [
-                        tx["date"].strftime("%m/%d/%Y"),
+                        tx["date_str"],
                         tx["type"],
                         tx["symbol"],
                         tx["shares"],
@@ -352,7 +509,7 @@ Thank you for choosing Fidelity Investments.
             for tx in etf_transactions:
                 tx_rows.append(
                     [
-                        tx["date"].strftime("%m/%d/%Y"),
+                        tx["date_str"],
                         tx["type"],
                         tx["symbol"],
                         tx["shares"],
@@ -363,7 +520,7 @@ Thank you for choosing Fidelity Investments.
             for tx in bond_transactions:
                 tx_rows.append(
                     [
-                        tx["date"].strftime("%m/%d/%Y"),
+                        tx["date_str"],
                         tx["type"],
                         tx["bond"],
                         tx["units"],
@@ -378,8 +535,14 @@ Thank you for choosing Fidelity Investments.
             ]
 
             statement_file = investments_folder / f"Investment_Statement_{year}.xlsx"
-            create_workbook(statement_file, sheets)
-            created_files.append(statement_file)
-            print(f"    ✓ Generated investment statement for {year}")
+            statement_files.append(statement_file)
+            workbook_sheets.append(sheets)
+        
+        # Statements are drawn above in year order so seeded runs reproduce;
+        # only the independent workbook saves run concurrently
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            created_files.extend(pool.map(create_workbook, statement_files, workbook_sheets))
+        
+        print("\n".join(f"    ✓ Generated investment statement for {year}" for year in TAX_YEARS))
         
         return created_files
@@ -4,13 +4,15 @@ Office Documents Generator
 Creates realistic office documents (reports, presentations, spreadsheets)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import math
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from config import USER_NAME, USER_EMAIL, COMPANY_NAME, CURRENT_DATE
 from utils.helpers import (
-    format_currency,
     ensure_directory,
     random_date,
     create_pdf,
@@ -19,31 +21,62 @@ from utils.helpers import (
 )
 
 
-class OfficeDocumentGenerator:
-    """Generates realistic office documents"""
-    
-    def __init__(self, base_path):
-        self.base_path = Path(base_path)
-    
-    def generate_quarterly_report(self, quarter, year):
-        """Generate quarterly business report"""
-        q_months = {
-            1: ("January", "February", "March"),
-            2: ("April", "May", "June"),
-            3: ("July", "August", "September"),
-            4: ("October", "November", "December")
-        }
-        
-        months = q_months[quarter]
-        
-        content = f"""QUARTERLY BUSINESS REPORT
-Q{quarter} {year}
+# Config values substituted into the %-style document templates below
+TEMPLATE_FIELDS = {
+    "user_name": USER_NAME,
+    "user_email": USER_EMAIL,
+    "company_name": COMPANY_NAME,
+}
+
+QUARTER_MONTHS = {
+    1: ("January", "February", "March"),
+    2: ("April", "May", "June"),
+    3: ("July", "August", "September"),
+    4: ("October", "November", "December")
+}
+
+# (quarter, year) of each quarterly report PDF; 2025 has none yet
+REPORT_QUARTERS = ((1, 2024), (2, 2024), (3, 2024), (4, 2024))
+
+# Sheet layout shared by every budget tracking workbook; tuples, so the
+# same rows can be handed to each create_workbook call untouched
+BUDGET_SHEETS = (
+    ("Budget", (
+        ("Category", "Jan", "Feb", "Mar", "Q1 Total", "Budget", "Variance"),
+        ("Salaries", "85000", "85000", "87000", "257000", "255000", "-2000"),
+        ("Cloud Services", "12500", "13200", "12800", "38500", "40000", "1500"),
+        ("Software Licenses", "5400", "5400", "5600", "16400", "18000", "1600"),
+        ("Office Supplies", "450", "380", "520", "1350", "1500", "150"),
+        ("Training", "2000", "1500", "3000", "6500", "6000", "-500"),
+    )),
+)
+
+PROJECT_NAMES = [
+    "Customer Portal Redesign",
+    "Mobile App Enhancement",
+    "Data Analytics Platform",
+    "Payment System Upgrade",
+    "Real-time Notification Service"
+]
+
+PRESENTATION_TOPICS = [
+    "Q4 Engineering Roadmap",
+    "System Architecture Review",
+    "New Product Launch Strategy",
+    "Team Performance Metrics",
+    "Technology Stack Modernization"
+]
+
+# Budget figures in these documents are fixed, so they are written out
+# already formatted rather than passed through format_currency per call
+QUARTERLY_REPORT_TEMPLATE = """QUARTERLY BUSINESS REPORT
+Q%(quarter)s %(year)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
-COMPANY: {COMPANY_NAME}
-PREPARED BY: {USER_NAME}
-DATE: {months[2]} 30, {year}
+COMPANY: %(company_name)s
+PREPARED BY: %(user_name)s
+DATE: %(last_month)s 30, %(year)s
 DEPARTMENT: Engineering & Technology
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -51,12 +84,12 @@ DEPARTMENT: Engineering & Technology
 EXECUTIVE SUMMARY
 
 This report summarizes the key achievements, challenges, and metrics for the
-Engineering department during Q{quarter} {year} ({months[0]}-{months[2]}).
+Engineering department during Q%(quarter)s %(year)s (%(first_month)s-%(last_month)s).
 
 Key Highlights:
 • Successfully deployed 3 major feature releases
-• Improved system uptime to 99.97%
-• Reduced average response time by 23%
+• Improved system uptime to 99.97%%
+• Reduced average response time by 23%%
 • Onboarded 2 new senior engineers
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -64,22 +97,22 @@ Key Highlights:
 PERFORMANCE METRICS
 
 Development Velocity:
-  - Story points completed: {random.randint(180, 250)}
-  - Sprint velocity average: {random.randint(35, 50)} points/sprint
-  - Code commits: {random.randint(450, 750)}
-  - Pull requests merged: {random.randint(120, 200)}
+  - Story points completed: %(story_points)s
+  - Sprint velocity average: %(sprint_velocity)s points/sprint
+  - Code commits: %(commits)s
+  - Pull requests merged: %(pull_requests)s
 
 System Performance:
-  - Uptime: 99.{random.randint(94, 99)}%
-  - Average response time: {random.randint(85, 150)}ms
-  - Error rate: 0.{random.randint(1, 5):02d}%
-  - Peak concurrent users: {random.randint(8000, 15000):,}
+  - Uptime: 99.%(uptime)s%%
+  - Average response time: %(response_time)sms
+  - Error rate: 0.%(error_rate)02d%%
+  - Peak concurrent users: %(peak_users)s
 
 Quality Metrics:
-  - Test coverage: {random.randint(82, 94)}%
-  - Bugs resolved: {random.randint(45, 85)}
-  - Production incidents: {random.randint(2, 6)}
-  - Customer-reported issues: {random.randint(8, 18)}
+  - Test coverage: %(test_coverage)s%%
+  - Bugs resolved: %(bugs_resolved)s
+  - Production incidents: %(incidents)s
+  - Customer-reported issues: %(customer_issues)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -94,7 +127,7 @@ MAJOR ACCOMPLISHMENTS
    sensitive data storage, passing security audit with zero critical findings.
    
 3. API PERFORMANCE OPTIMIZATION
-   Reduced API latency by 35% through query optimization and caching
+   Reduced API latency by 35%% through query optimization and caching
    strategies, improving overall user experience.
 
 4. DATABASE UPGRADE
@@ -117,7 +150,7 @@ Lessons Learned:
 
 ═══════════════════════════════════════════════════════════════════════════
 
-UPCOMING PRIORITIES FOR Q{quarter + 1 if quarter < 4 else 1} {year if quarter < 4 else year + 1}
+UPCOMING PRIORITIES FOR Q%(next_quarter)s %(next_year)s
 
 1. Launch mobile app version 2.0
 2. Implement real-time analytics dashboard
@@ -130,60 +163,45 @@ UPCOMING PRIORITIES FOR Q{quarter + 1 if quarter < 4 else 1} {year if quarter <
 BUDGET SUMMARY
 
                         Budgeted        Actual       Variance
-Personnel              {format_currency(180000)}    {format_currency(175000)}     {format_currency(5000)}
-Infrastructure         {format_currency(45000)}     {format_currency(48500)}    ({format_currency(3500)})
-Software/Tools         {format_currency(25000)}     {format_currency(24200)}      {format_currency(800)}
-Training               {format_currency(10000)}     {format_currency(8500)}      {format_currency(1500)}
+Personnel              $180,000.00    $175,000.00     $5,000.00
+Infrastructure         $45,000.00     $48,500.00    ($3,500.00)
+Software/Tools         $25,000.00     $24,200.00      $800.00
+Training               $10,000.00     $8,500.00      $1,500.00
                        ──────────────────────────────────────────────
-TOTAL                  {format_currency(260000)}    {format_currency(256200)}     {format_currency(3800)}
+TOTAL                  $260,000.00    $256,200.00     $3,800.00
 
 ═══════════════════════════════════════════════════════════════════════════
 
 CONCLUSION
 
-Q{quarter} was a productive quarter with significant progress on key initiatives.
+Q%(quarter)s was a productive quarter with significant progress on key initiatives.
 The team demonstrated resilience and adaptability in addressing challenges while
 maintaining high quality standards. Looking ahead, we are well-positioned to
 execute on our roadmap for the next quarter.
 
-Prepared by: {USER_NAME}
+Prepared by: %(user_name)s
 Title: Senior Engineering Manager
-Date: {months[2]} 30, {year}
+Date: %(last_month)s 30, %(year)s
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_project_proposal(self):
-        """Generate project proposal document"""
-        
-        project_names = [
-            "Customer Portal Redesign",
-            "Mobile App Enhancement",
-            "Data Analytics Platform",
-            "Payment System Upgrade",
-            "Real-time Notification Service"
-        ]
-        
-        project_name = random.choice(project_names)
-        
-        content = f"""PROJECT PROPOSAL
+
+PROJECT_PROPOSAL_TEMPLATE = """PROJECT PROPOSAL
 
 ═══════════════════════════════════════════════════════════════════════════
 
-PROJECT TITLE: {project_name}
+PROJECT TITLE: %(project_name)s
 
-Submitted by: {USER_NAME}
+Submitted by: %(user_name)s
 Department: Engineering
-Date: {CURRENT_DATE.strftime('%B %d, %Y')}
+Date: %(date)s
 Version: 1.0
 
 ═══════════════════════════════════════════════════════════════════════════
 
 1. PROJECT OVERVIEW
 
-This proposal outlines the plan to develop and implement {project_name}.
+This proposal outlines the plan to develop and implement %(project_name)s.
 The project aims to improve user experience, increase system efficiency,
 and provide better insights into business operations.
 
@@ -198,13 +216,13 @@ Current Challenges:
 • Increasing maintenance costs
 
 Expected Benefits:
-• 40% improvement in user engagement
-• 50% reduction in page load times
+• 40%% improvement in user engagement
+• 50%% reduction in page load times
 • Enhanced data-driven decision making
 • Lower operational costs
 
 ROI: Expected payback period of 18 months with projected annual savings
-     of {format_currency(150000)}
+     of $150,000.00
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -269,13 +287,13 @@ Infrastructure:
 
 6. BUDGET ESTIMATE
 
-Personnel Costs                    {format_currency(280000)}
-Infrastructure & Tools             {format_currency(45000)}
-Software Licenses                  {format_currency(15000)}
-Training & Documentation           {format_currency(10000)}
-Contingency (10%)                  {format_currency(35000)}
+Personnel Costs                    $280,000.00
+Infrastructure & Tools             $45,000.00
+Software Licenses                  $15,000.00
+Training & Documentation           $10,000.00
+Contingency (10%%)                  $35,000.00
                                    ─────────────
-TOTAL PROJECT COST                 {format_currency(385000)}
+TOTAL PROJECT COST                 $385,000.00
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -296,10 +314,10 @@ Timeline delays                Medium         Medium      Buffer time in schedul
 The project will be considered successful when:
 ✓ All functional requirements are met
 ✓ Performance targets are achieved (sub-200ms response time)
-✓ User satisfaction score > 85%
+✓ User satisfaction score > 85%%
 ✓ Zero critical bugs in production
 ✓ Deployment completed on schedule
-✓ Budget variance < 10%
+✓ Budget variance < 10%%
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -314,7 +332,7 @@ well with our strategic objectives for digital transformation.
 APPROVALS
 
 Prepared by:
-  Name: {USER_NAME}
+  Name: %(user_name)s
   Title: Senior Engineering Manager
   Signature: ________________________    Date: _______________
 
@@ -325,38 +343,23 @@ Approved by:
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_meeting_presentation(self):
-        """Generate presentation outline"""
-        
-        topics = [
-            "Q4 Engineering Roadmap",
-            "System Architecture Review",
-            "New Product Launch Strategy",
-            "Team Performance Metrics",
-            "Technology Stack Modernization"
-        ]
-        
-        topic = random.choice(topics)
-        
-        content = f"""PRESENTATION OUTLINE
-{topic}
+
+PRESENTATION_OUTLINE_TEMPLATE = """PRESENTATION OUTLINE
+%(topic)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
-Presenter: {USER_NAME}
-Date: {CURRENT_DATE.strftime('%B %d, %Y')}
+Presenter: %(user_name)s
+Date: %(date)s
 Audience: Executive Team & Stakeholders
 Duration: 45 minutes
 
 ═══════════════════════════════════════════════════════════════════════════
 
 SLIDE 1: TITLE SLIDE
-  - {topic}
-  - {USER_NAME}, {COMPANY_NAME}
-  - {CURRENT_DATE.strftime('%B %Y')}
+  - %(topic)s
+  - %(user_name)s, %(company_name)s
+  - %(month)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -373,7 +376,7 @@ SLIDE 2: AGENDA
 SLIDE 3: CURRENT STATE OVERVIEW
   • System Architecture Diagram
   • Current Performance Metrics
-    - Uptime: 99.9%
+    - Uptime: 99.9%%
     - Response Time: 120ms avg
     - Daily Active Users: 50,000+
   • Team Structure (15 engineers)
@@ -420,9 +423,9 @@ SLIDE 6: IMPLEMENTATION TIMELINE
 SLIDE 7: EXPECTED OUTCOMES
   
   Technical Benefits:
-  • 50% faster deployment cycles
-  • 99.99% uptime target
-  • 40% reduction in response time
+  • 50%% faster deployment cycles
+  • 99.99%% uptime target
+  • 40%% reduction in response time
   • Better fault isolation
 
   Business Benefits:
@@ -435,14 +438,14 @@ SLIDE 7: EXPECTED OUTCOMES
 
 SLIDE 8: BUDGET & RESOURCES
   
-  Total Investment: {format_currency(450000)}
+  Total Investment: $450,000.00
   
   Breakdown:
-  • Infrastructure: {format_currency(200000)}
-  • Tools & Licenses: {format_currency(80000)}
-  • Training: {format_currency(40000)}
-  • Consulting: {format_currency(100000)}
-  • Contingency: {format_currency(30000)}
+  • Infrastructure: $200,000.00
+  • Tools & Licenses: $80,000.00
+  • Training: $40,000.00
+  • Consulting: $100,000.00
+  • Contingency: $30,000.00
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -475,8 +478,8 @@ SLIDE 11: Q&A
   Questions?
   
   Contact Information:
-  {USER_NAME}
-  {USER_EMAIL}
+  %(user_name)s
+  %(user_email)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -489,14 +492,9 @@ NOTES FOR PRESENTER:
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_spreadsheet_data(self):
-        """Generate spreadsheet-like data"""
-        
-        content = f"""BUDGET TRACKING SPREADSHEET
-Engineering Department - {CURRENT_DATE.year}
+
+BUDGET_SPREADSHEET_TEMPLATE = """BUDGET TRACKING SPREADSHEET
+Engineering Department - %(year)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
@@ -522,94 +520,170 @@ NOTES:
 • Equipment purchased for new hires in Q1
 • Overall Q1 came in under budget by $2,300
 
-PREPARED BY: {USER_NAME}
-DATE: {CURRENT_DATE.strftime('%B %d, %Y')}
+PREPARED BY: %(user_name)s
+DATE: %(date)s
 
 ═══════════════════════════════════════════════════════════════════════════
 """
+
+
+# (template field, low, high) for the random figures in each quarterly
+# report; bounds are inclusive, as with random.randint
+QUARTERLY_METRIC_RANGES = (
+    ("story_points", 180, 250),
+    ("sprint_velocity", 35, 50),
+    ("commits", 450, 750),
+    ("pull_requests", 120, 200),
+    ("uptime", 94, 99),
+    ("response_time", 85, 150),
+    ("error_rate", 1, 5),
+    ("peak_users", 8000, 15000),
+    ("test_coverage", 82, 94),
+    ("bugs_resolved", 45, 85),
+    ("incidents", 2, 6),
+    ("customer_issues", 8, 18),
+)
+# Number of distinct combinations of the metrics above
+QUARTERLY_METRIC_SPACE = math.prod(high - low + 1 for _, low, high in QUARTERLY_METRIC_RANGES)
+
+
+def _quarterly_metrics():
+    """
+    Draw every quarterly report metric from a single randrange call and
+    decode the result digit by digit, each range acting as one radix
+    """
+    n = random.randrange(QUARTERLY_METRIC_SPACE)
+    metrics = {}
+    for field, low, high in QUARTERLY_METRIC_RANGES:
+        n, offset = divmod(n, high - low + 1)
+        metrics[field] = low + offset
+    return metrics
+
+
+@lru_cache(maxsize=None)
+def _date_fields(date):
+    """Template fields derived from the document date, formatted once per date"""
+    return {
+        "date": date.strftime('%B %d, %Y'),
+        "month": date.strftime('%B %Y'),
+        "year": date.year,
+    }
+
+
+class OfficeDocumentGenerator:
+    """Generates realistic office documents"""
+    
+    def __init__(self, base_path):
+        self.base_path = Path(base_path)
+    
+    def generate_quarterly_report(self, quarter, year):
+        """Generate quarterly business report"""
+        months = QUARTER_MONTHS[quarter]
+        metrics = _quarterly_metrics()
+        metrics['peak_users'] = f"{metrics['peak_users']:,}"
         
-        return content
+        return QUARTERLY_REPORT_TEMPLATE % dict(
+            TEMPLATE_FIELDS,
+            **metrics,
+            quarter=quarter,
+            year=year,
+            first_month=months[0],
+            last_month=months[2],
+            next_quarter=quarter + 1 if quarter < 4 else 1,
+            next_year=year if quarter < 4 else year + 1,
+        )
+    
+    def generate_project_proposal(self):
+        """Generate project proposal document"""
+        return PROJECT_PROPOSAL_TEMPLATE % dict(
+            TEMPLATE_FIELDS,
+            **_date_fields(CURRENT_DATE),
+            project_name=random.choice(PROJECT_NAMES),
+        )
+    
+    def generate_meeting_presentation(self):
+        """Generate presentation outline"""
+        return PRESENTATION_OUTLINE_TEMPLATE % dict(
+            TEMPLATE_FIELDS,
+            **_date_fields(CURRENT_DATE),
+            topic=random.choice(PRESENTATION_TOPICS),
+        )
+    
+    def generate_spreadsheet_data(self):
+        """Generate spreadsheet-like data"""
+        return BUDGET_SPREADSHEET_TEMPLATE % dict(TEMPLATE_FIELDS, **_date_fields(CURRENT_DATE))
     
     def generate_all_office_documents(self):
         """Generate all office documents"""
         created_files = []
+        futures = []
         
         print("\n[*] Generating office documents...")
         
-        office_folder = self.base_path / "Desktop" / "Office"
-        ensure_directory(office_folder)
-        
-        # Generate quarterly reports as PDFs
-        reports_folder = office_folder / "Reports"
-        ensure_directory(reports_folder)
-        
-        for year in [2024, 2025]:
-            for quarter in range(1, 5 if year == 2024 else 1):
+        # Content and its random draws are made here, in order, while the
+        # pool serialises earlier files; threads rather than processes, as
+        # forked workers would not share the seeded random state
+        with ThreadPoolExecutor() as pool:
+            def write(writer, path, *args):
+                futures.append(pool.submit(writer, path, *args))
+                created_files.append(path)
+
+            office_folder = self.base_path / "Desktop" / "Office"
+            ensure_directory(office_folder)
+
+            # Generate quarterly reports as PDFs
+            reports_folder = office_folder / "Reports"
+            ensure_directory(reports_folder)
+
+            for quarter, year in REPORT_QUARTERS:
                 report = self.generate_quarterly_report(quarter, year)
                 pdf_path = reports_folder / f"Q{quarter}_{year}_Report.pdf"
-                create_pdf(pdf_path, f"Q{quarter} {year} Business Report", [("Content", report)])
-                created_files.append(pdf_path)
-        
-        print(f"    ✓ Generated quarterly reports (PDF)")
-        
-        # Generate presentations with python-pptx
-        presentations_folder = office_folder / "Presentations"
-        ensure_directory(presentations_folder)
-        
-        base_slides = []
-        for i in range(3):
-            pres = self.generate_meeting_presentation()
-            base_slides.append({"title": f"Presentation {i+1}", "bullets": pres.splitlines()[:10]})
-        deck_path = presentations_folder / "Quarterly_Roadmap.pptx"
-        create_presentation(deck_path, base_slides)
-        created_files.append(deck_path)
-
-        ad_hoc_topics = ["Quarterly Townhall", "Incident Postmortem", "Recruiting Update", "Product Strategy"]
-        for topic in ad_hoc_topics:
-            slides = [
-                {"title": topic, "bullets": ["Overview", "Highlights", "Challenges", "Next Steps", "Q&A"]},
-                {"title": "Highlights", "bullets": ["Key wins", "Metrics", "Customer feedback"]},
-                {"title": "Risks", "bullets": ["Staffing", "Timeline", "Dependencies"]},
-            ]
-            deck_file = presentations_folder / f"{topic.replace(' ', '_')}.pptx"
-            create_presentation(deck_file, slides)
-            created_files.append(deck_file)
-        
-        print(f"    ✓ Generated presentations (PPTX)")
-        
-        # Generate spreadsheets using openpyxl
-        spreadsheets_folder = office_folder / "Spreadsheets"
-        ensure_directory(spreadsheets_folder)
-        
-        for i in range(2):
-            budget_file = spreadsheets_folder / f"Budget_Tracking_{i+1}.xlsx"
-            create_workbook(
-                budget_file,
-                [
-                    ("Budget", [
-                        ["Category", "Jan", "Feb", "Mar", "Q1 Total", "Budget", "Variance"],
-                        ["Salaries", "85000", "85000", "87000", "257000", "255000", "-2000"],
-                        ["Cloud Services", "12500", "13200", "12800", "38500", "40000", "1500"],
-                        ["Software Licenses", "5400", "5400", "5600", "16400", "18000", "1600"],
-                        ["Office Supplies", "450", "380", "520", "1350", "1500", "150"],
-                        ["Training", "2000", "1500", "3000", "6500", "6000", "-500"],
-                    ])
-                ],
-            )
-            created_files.append(budget_file)
-        
-        print(f"    ✓ Generated spreadsheets (XLSX)")
-        
-        # Generate project proposals as PDFs
-        projects_folder = office_folder / "Projects"
-        ensure_directory(projects_folder)
-        
-        for i in range(2):
-            proposal = self.generate_project_proposal()
-            pdf_path = projects_folder / f"Project_Proposal_{i+1}.pdf"
-            create_pdf(pdf_path, "Project Proposal", [("Proposal", proposal)])
-            created_files.append(pdf_path)
+                write(create_pdf, pdf_path, f"Q{quarter} {year} Business Report", [("Content", report)])
+
+            # Generate presentations with python-pptx
+            presentations_folder = office_folder / "Presentations"
+            ensure_directory(presentations_folder)
+
+            base_slides = []
+            for i in range(3):
+                pres = self.generate_meeting_presentation()
+                base_slides.append({"title": f"Presentation {i+1}", "bullets": pres.split("\n", 10)[:10]})
+            write(create_presentation, presentations_folder / "Quarterly_Roadmap.pptx", base_slides)
+
+            ad_hoc_topics = ["Quarterly Townhall", "Incident Postmortem", "Recruiting Update", "Product Strategy"]
+            for topic in ad_hoc_topics:
+                slides = [
+                    {"title": topic, "bullets": ["Overview", "Highlights", "Challenges", "Next Steps", "Q&A"]},
+                    {"title": "Highlights", "bullets": ["Key wins", "Metrics", "Customer feedback"]},
+                    {"title": "Risks", "bullets": ["Staffing", "Timeline", "Dependencies"]},
+                ]
+                write(create_presentation, presentations_folder / f"{topic.replace(' ', '_')}.pptx", slides)
+
+            # Generate spreadsheets using openpyxl
+            spreadsheets_folder = office_folder / "Spreadsheets"
+            ensure_directory(spreadsheets_folder)
+
+            for i in range(2):
+                budget_file = spreadsheets_folder / f"Budget_Tracking_{i+1}.xlsx"
+                write(create_workbook, budget_file, BUDGET_SHEETS)
+
+            # Generate project proposals as PDFs
+            projects_folder = office_folder / "Projects"
+            ensure_directory(projects_folder)
+
+            for i in range(2):
+                proposal = self.generate_project_proposal()
+                pdf_path = projects_folder / f"Project_Proposal_{i+1}.pdf"
+                write(create_pdf, pdf_path, "Project Proposal", [("Proposal", proposal)])
+
+        for future in futures:
+            future.result()
         
-        print(f"    ✓ Generated project proposals (PDF)")
+        print("\n".join([
+            "    ✓ Generated quarterly reports (PDF)",
+            "    ✓ Generated presentations (PPTX)",
+            "    ✓ Generated spreadsheets (XLSX)",
+            "    ✓ Generated project proposals (PDF)",
+        ]))
         
         return created_files
@@ -4,6 +4,7 @@ Personal Folders Generator
 Creates realistic personal files (music, photos, health records, receipts)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import random
 import base64
 from datetime import datetime, timedelta
@@ -12,8 +13,9 @@ from pathlib import Path
 from config import USER_NAME, USER_PHONE, USER_ADDRESS, USER_CITY, USER_STATE, USER_ZIP, USER_DOB
 from utils.helpers import (
     format_currency,
+    random_ints,
     ensure_directory,
-    write_binary_file,
+    write_utf8,
     create_pdf,
 )
 
@@ -25,99 +27,82 @@ SAMPLE_JPEG_BYTES = base64.b64decode(
     "xAAUEQEAAAAAAAAAAAAAAAAAAAAA/9oADAMBAAIRAxEAPwCfAAH/2Q=="
 )
 
+# Separators used in the playlist, photo catalog and receipts
+HEADER_SEPARATOR = "=" * 70
+PHOTO_SEPARATOR = "-" * 70
+TOTALS_SEPARATOR = "─" * 70
+RECEIPT_FOOTER_SEPARATOR = "═" * 70
+
+# (title, artist, duration) rows of the main playlist
+PLAYLIST_SONGS = (
+    ("Bohemian Rhapsody", "Queen", "4:55"),
+    ("Stairway to Heaven", "Led Zeppelin", "8:02"),
+    ("Hotel California", "Eagles", "6:30"),
+    ("Imagine", "John Lennon", "3:03"),
+    ("Sweet Child O' Mine", "Guns N' Roses", "5:56"),
+    ("Billie Jean", "Michael Jackson", "4:54"),
+    ("Smells Like Teen Spirit", "Nirvana", "5:01"),
+    ("November Rain", "Guns N' Roses", "8:57"),
+    ("One", "Metallica", "7:27"),
+    ("Wonderwall", "Oasis", "4:18"),
+    ("Lose Yourself", "Eminem", "5:26"),
+    ("Rolling in the Deep", "Adele", "3:48"),
+    ("Shape of You", "Ed Sheeran", "3:53"),
+    ("Blinding Lights", "The Weeknd", "3:20"),
+    ("Someone Like You", "Adele", "4:45"),
+    ("Uptown Funk", "Mark Ronson ft. Bruno Mars", "4:30"),
+    ("Thinking Out Loud", "Ed Sheeran", "4:41"),
+    ("Stay", "The Kid LAROI & Justin Bieber", "2:21"),
+    ("Levitating", "Dua Lipa", "3:23"),
+    ("Good 4 U", "Olivia Rodrigo", "2:58"),
+)
+
+PHOTO_CATEGORIES = (
+    "Vacation", "Family", "Friends", "Work Event", "Birthday",
+    "Holiday", "Weekend Trip", "Concert", "Sports", "Nature",
+)
+
+PHOTO_RESOLUTIONS = ("4032x3024", "3024x4032", "1920x1080", "3840x2160")
+
+# (store, category) pairs a receipt can come from
+RECEIPT_STORES = (
+    ("Whole Foods Market", "Groceries"),
+    ("Best Buy", "Electronics"),
+    ("Target", "General Merchandise"),
+    ("CVS Pharmacy", "Pharmacy/Health"),
+    ("Home Depot", "Home Improvement"),
+    ("Amazon.com", "Online Shopping"),
+    ("Costco", "Wholesale"),
+)
+
+# (item, price) lines a receipt picks from
+RECEIPT_ITEMS = (
+    ("Organic Bananas", 3.99),
+    ("Greek Yogurt", 5.49),
+    ("Whole Wheat Bread", 4.29),
+    ("Chicken Breast", 12.99),
+    ("Mixed Greens", 4.99),
+    ("Coffee Beans", 14.99),
+    ("Almond Milk", 3.79),
+    ("Pasta", 2.99),
+    ("Olive Oil", 9.99),
+    ("Tomatoes", 4.50),
+)
+# Each item's printed receipt line, padded and priced once at import
+RECEIPT_ITEM_LINES = {
+    item: f"{item:40} {format_currency(price):>10}\n" for item, price in RECEIPT_ITEMS
+}
 
-class PersonalFoldersGenerator:
-    """Generates realistic personal files and folders"""
-    
-    def __init__(self, base_path):
-        self.base_path = Path(base_path)
-    
-    def generate_music_playlist(self):
-        """Generate music playlist file"""
-        
-        songs = [
-            ("Bohemian Rhapsody", "Queen", "4:55"),
-            ("Stairway to Heaven", "Led Zeppelin", "8:02"),
-            ("Hotel California", "Eagles", "6:30"),
-            ("Imagine", "John Lennon", "3:03"),
-            ("Sweet Child O' Mine", "Guns N' Roses", "5:56"),
-            ("Billie Jean", "Michael Jackson", "4:54"),
-            ("Smells Like Teen Spirit", "Nirvana", "5:01"),
-            ("November Rain", "Guns N' Roses", "8:57"),
-            ("One", "Metallica", "7:27"),
-            ("Wonderwall", "Oasis", "4:18"),
-            ("Lose Yourself", "Eminem", "5:26"),
-            ("Rolling in the Deep", "Adele", "3:48"),
-            ("Shape of You", "Ed Sheeran", "3:53"),
-            ("Blinding Lights", "The Weeknd", "3:20"),
-            ("Someone Like You", "Adele", "4:45"),
-            ("Uptown Funk", "Mark Ronson ft. Bruno Mars", "4:30"),
-            ("Thinking Out Loud", "Ed Sheeran", "4:41"),
-            ("Stay", "The Kid LAROI & Justin Bieber", "2:21"),
-            ("Levitating", "Dua Lipa", "3:23"),
-            ("Good 4 U", "Olivia Rodrigo", "2:58")
-        ]
-        
-        content = "MY MUSIC PLAYLIST\n"
-        content += f"Owner: {USER_NAME}\n"
-        content += f"Created: {datetime.now().strftime('%B %d, %Y')}\n"
-        content += f"Total Songs: {len(songs)}\n\n"
-        content += "="*70 + "\n\n"
-        
-        for i, (title, artist, duration) in enumerate(songs, 1):
-            content += f"{i:2}. {title:40} - {artist:30} [{duration}]\n"
-        
-        return content
-    
-    def generate_photo_catalog(self, num_photos=15):
-        """Generate photo catalog/list"""
-        
-        photo_categories = [
-            "Vacation", "Family", "Friends", "Work Event", "Birthday",
-            "Holiday", "Weekend Trip", "Concert", "Sports", "Nature"
-        ]
-        
-        content = "PHOTO CATALOG\n"
-        content += f"Owner: {USER_NAME}\n"
-        content += f"Last Updated: {datetime.now().strftime('%B %d, %Y')}\n\n"
-        content += "="*70 + "\n\n"
-        
-        entries = []
-        for i in range(num_photos):
-            date = datetime.now() - timedelta(days=random.randint(1, 365*3))
-            category = random.choice(photo_categories)
-            filename = f"IMG_{random.randint(1000, 9999)}.jpg"
-            entries.append(
-                {
-                    "filename": filename,
-                    "date": date,
-                    "category": category,
-                    "resolution": random.choice(["4032x3024", "3024x4032", "1920x1080", "3840x2160"]),
-                    "size_mb": f"{random.randint(1, 8)}.{random.randint(1, 9)}MB",
-                }
-            )
-            
-            content += f"File: {filename}\n"
-            content += f"Date: {date.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            content += f"Category: {category}\n"
-            content += f"Size: {entries[-1]['size_mb']}\n"
-            content += f"Resolution: {entries[-1]['resolution']}\n"
-            content += "-"*70 + "\n\n"
-        
-        return content, entries
-    
-    def generate_health_records(self):
-        """Generate health records summary"""
-        
-        content = f"""PERSONAL HEALTH RECORDS
-{USER_NAME}
+
+HEALTH_RECORDS_TEMPLATE = """PERSONAL HEALTH RECORDS
+%(user_name)s
 
 ═══════════════════════════════════════════════════════════════════════════
 
 PERSONAL INFORMATION
 
-Name: {USER_NAME}
-Date of Birth: {USER_DOB}
+Name: %(user_name)s
+Date of Birth: %(dob)s
 Blood Type: O+
 Allergies: None known
 Emergency Contact: Sarah Mathew - (415) 555-0198
@@ -201,73 +186,154 @@ NOTES
 
 ═══════════════════════════════════════════════════════════════════════════
 """
+
+# The health summary only depends on config, so it is rendered once at import
+HEALTH_RECORDS_TEXT = HEALTH_RECORDS_TEMPLATE % {"user_name": USER_NAME, "dob": USER_DOB}
+
+
+def _run_writes(writes):
+    """
+    Perform (writer, path, *args) file writes concurrently. All content is
+    rendered before this is called, so only I/O runs on the pool threads.
+    Returns the paths in the order given.
+    """
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(writer, path, *args) for writer, path, *args in writes]
+        for future in futures:
+            future.result()
+    return [path for _, path, *_ in writes]
+
+
+class PersonalFoldersGenerator:
+    """Generates realistic personal files and folders"""
+    
+    def __init__(self, base_path):
+        self.base_path = Path(base_path)
+    
+    def _padded_sample(self, min_pad, max_pad):
+        """SAMPLE_JPEG_BYTES followed by min_pad..max_pad bytes of fresh random padding"""
+        return SAMPLE_JPEG_BYTES + random.randbytes(random.randint(min_pad, max_pad))
+    
+    def generate_music_playlist(self, now=None):
+        """Generate music playlist file"""
+        if now is None:
+            now = datetime.now()
+        
+        header = (
+            "MY MUSIC PLAYLIST\n"
+            f"Owner: {USER_NAME}\n"
+            f"Created: {now.strftime('%B %d, %Y')}\n"
+            f"Total Songs: {len(PLAYLIST_SONGS)}\n\n"
+            f"{HEADER_SEPARATOR}\n\n"
+        )
+        rows = "".join(
+            f"{i:2}. {title:40} - {artist:30} [{duration}]\n"
+            for i, (title, artist, duration) in enumerate(PLAYLIST_SONGS, 1)
+        )
+        
+        return header + rows
+    
+    def generate_photo_catalog(self, num_photos=15, now=None):
+        """Generate photo catalog/list"""
+        if now is None:
+            now = datetime.now()
+        
+        parts = [
+            "PHOTO CATALOG\n"
+            f"Owner: {USER_NAME}\n"
+            f"Last Updated: {now.strftime('%B %d, %Y')}\n\n"
+            f"{HEADER_SEPARATOR}\n\n"
+        ]
         
-        return content
+        # One draw per field for the whole catalog; image numbers are sampled
+        # without replacement so two photos never share a filename
+        draws = zip(
+            random_ints(1, 365*3, num_photos),
+            random.choices(PHOTO_CATEGORIES, k=num_photos),
+            random.sample(range(1000, 10000), num_photos),
+            random.choices(PHOTO_RESOLUTIONS, k=num_photos),
+            random_ints(1, 8, num_photos),
+            random_ints(1, 9, num_photos),
+        )
+        entries = []
+        for days_ago, category, image_number, resolution, size_major, size_minor in draws:
+            date = now - timedelta(days=days_ago)
+            filename = f"IMG_{image_number}.jpg"
+            # Both timestamp forms are formatted here, in one pass; the
+            # sidecar writer reuses captured_at
+            taken = date.strftime('%Y-%m-%d %H:%M:%S')
+            entries.append(
+                {
+                    "filename": filename,
+                    "date": date,
+                    "captured_at": date.isoformat(),
+                    "category": category,
+                    "resolution": resolution,
+                    "size_mb": f"{size_major}.{size_minor}MB",
+                }
+            )
+            
+            parts.append(
+                f"File: {filename}\n"
+                f"Date: {taken}\n"
+                f"Category: {category}\n"
+                f"Size: {entries[-1]['size_mb']}\n"
+                f"Resolution: {entries[-1]['resolution']}\n"
+                f"{PHOTO_SEPARATOR}\n\n"
+            )
+        
+        return "".join(parts), entries
+    
+    def generate_health_records(self):
+        """Generate health records summary"""
+        return HEALTH_RECORDS_TEXT
 
-    def create_photo_files(self, photos_folder, entries):
-        """
-        Materialize small JPEGs so the photo directory is not just text.
-        """
-        created = []
+    def _photo_file_writes(self, photos_folder, entries):
+        """(writer, path, data) for each photo and its metadata sidecar"""
+        writes = []
         metadata_folder = photos_folder / "metadata"
-        ensure_directory(metadata_folder)
 
         for entry in entries:
             photo_path = photos_folder / entry["filename"]
             # Pad the base image so file sizes differ slightly
-            padded_bytes = SAMPLE_JPEG_BYTES + random.randbytes(random.randint(512, 2048))
-            write_binary_file(photo_path, padded_bytes)
-            created.append(photo_path)
+            padded_bytes = self._padded_sample(512, 2048)
+            writes.append((Path.write_bytes, photo_path, padded_bytes))
 
             # Write sidecar metadata to make the folder look populated
             metadata = (
                 f"filename={entry['filename']}\n"
-                f"captured_at={entry['date'].isoformat()}\n"
+                f"captured_at={entry['captured_at']}\n"
                 f"category={entry['category']}\n"
                 f"resolution={entry['resolution']}\n"
                 f"size={entry['size_mb']}\n"
                 f"camera=Pixel 7 Pro\n"
             )
             sidecar = metadata_folder / f"{photo_path.stem}.xmp"
-            sidecar.write_text(metadata, encoding="utf-8")
-            created.append(sidecar)
+            writes.append((write_utf8, sidecar, metadata))
+
+        return writes
 
-        return created
+    def create_photo_files(self, photos_folder, entries):
+        """
+        Materialize small JPEGs so the photo directory is not just text.
+        """
+        ensure_directory(photos_folder / "metadata")
+        return _run_writes(self._photo_file_writes(photos_folder, entries))
     
-    def generate_receipt(self):
-        """Generate shopping receipt"""
+    def generate_receipt(self, now=None):
+        """Generate shopping receipt; returns (content, purchase date)"""
+        if now is None:
+            now = datetime.now()
         
-        stores = [
-            ("Whole Foods Market", "Groceries"),
-            ("Best Buy", "Electronics"),
-            ("Target", "General Merchandise"),
-            ("CVS Pharmacy", "Pharmacy/Health"),
-            ("Home Depot", "Home Improvement"),
-            ("Amazon.com", "Online Shopping"),
-            ("Costco", "Wholesale")
-        ]
-        
-        store, category = random.choice(stores)
-        date = datetime.now() - timedelta(days=random.randint(1, 90))
-        
-        items = [
-            ("Organic Bananas", 3.99),
-            ("Greek Yogurt", 5.49),
-            ("Whole Wheat Bread", 4.29),
-            ("Chicken Breast", 12.99),
-            ("Mixed Greens", 4.99),
-            ("Coffee Beans", 14.99),
-            ("Almond Milk", 3.79),
-            ("Pasta", 2.99),
-            ("Olive Oil", 9.99),
-            ("Tomatoes", 4.50)
-        ]
+        store, category = random.choice(RECEIPT_STORES)
+        date = now - timedelta(days=random.randint(1, 90))
         
         # Select random items
         num_items = random.randint(3, 7)
-        selected_items = random.sample(items, num_items)
+        selected_items = random.sample(RECEIPT_ITEMS, num_items)
+        transaction_number, approval_code = random_ints(100000, 999999, 2)
         
-        content = f"""{store}
+        parts = [f"""{store}
 {category}
 
 {USER_ADDRESS}
@@ -276,7 +342,7 @@ Phone: {USER_PHONE}
 
 ═══════════════════════════════════════════════════════════════════════════
 
-Transaction #{random.randint(100000, 999999)}
+Transaction #{transaction_number}
 Date: {date.strftime('%m/%d/%Y %I:%M %p')}
 Cashier: #{random.randint(100, 999)}
 
@@ -284,50 +350,55 @@ Cashier: #{random.randint(100, 999)}
 
 ITEMS PURCHASED:
 
-"""
+"""]
         
         subtotal = 0
         for item, price in selected_items:
-            content += f"{item:40} {format_currency(price):>10}\n"
+            parts.append(RECEIPT_ITEM_LINES[item])
             subtotal += price
         
         tax = round(subtotal * 0.0875, 2)  # CA sales tax
         total = subtotal + tax
         
-        content += "\n"
-        content += "─"*70 + "\n"
-        content += f"{'SUBTOTAL':40} {format_currency(subtotal):>10}\n"
-        content += f"{'TAX (8.75%)':40} {format_currency(tax):>10}\n"
-        content += "─"*70 + "\n"
-        content += f"{'TOTAL':40} {format_currency(total):>10}\n\n"
-        
-        content += f"PAYMENT METHOD: Visa ending in 5847\n"
-        content += f"APPROVAL CODE: {random.randint(100000, 999999)}\n\n"
-        
-        content += "Thank you for shopping with us!\n"
-        content += "Please visit www.{}.com for deals\n".format(store.lower().replace(" ", ""))
-        
-        content += "\n" + "═"*70 + "\n"
-        
-        return content
+        parts.append(
+            f"\n{TOTALS_SEPARATOR}\n"
+            f"{'SUBTOTAL':40} {format_currency(subtotal):>10}\n"
+            f"{'TAX (8.75%)':40} {format_currency(tax):>10}\n"
+            f"{TOTALS_SEPARATOR}\n"
+            f"{'TOTAL':40} {format_currency(total):>10}\n\n"
+            "PAYMENT METHOD: Visa ending in 5847\n"
+            f"APPROVAL CODE: {approval_code}\n\n"
+            "Thank you for shopping with us!\n"
+            f"Please visit www.{store.lower().replace(' ', '')}.com for deals\n"
+            f"\n{RECEIPT_FOOTER_SEPARATOR}\n"
+        )
+        
+        return "".join(parts), date
     
     def generate_all_personal_folders(self):
         """Generate all personal folders and files"""
-        created_files = []
+        # (writer, path, *args) for every file, in output order; content and
+        # its random draws are made here, the writes happen in a pool below
+        writes = []
+        now = datetime.now()
         
         print("\n[*] Generating personal folders...")
         
         personal_folder = self.base_path / "Desktop" / "Personal"
-        ensure_directory(personal_folder)
+        music_folder = personal_folder / "Music"
+        photos_folder = personal_folder / "Photos"
+        health_folder = personal_folder / "Health"
+        receipts_folder = personal_folder / "Receipts"
+        
+        # Only the leaves need creating; mkdir(parents=True) makes the rest,
+        # so the per-file writes below can skip any directory checks
+        for folder in (music_folder, photos_folder / "metadata", health_folder, receipts_folder):
+            ensure_directory(folder)
         
         # Music folder
-        music_folder = personal_folder / "Music"
-        ensure_directory(music_folder)
         
-        playlist = self.generate_music_playlist()
-        playlist_file = music_folder / "My_Playlist.m3u"
-        playlist_file.write_text(playlist, encoding='utf-8')
-        created_files.append(playlist_file)
+        playlist = self.generate_music_playlist(now)
+        writes.append((write_utf8, music_folder / "My_Playlist.m3u", playlist))
         
         # Additional playlists
         playlists_names = ["Workout Mix", "Chill Vibes", "Road Trip"]
@@ -336,55 +407,42 @@ ITEMS PURCHASED:
                 f"#EXTM3U\n#PLAYLIST:{name}\n# Created for {name.lower()} moments.\n"
                 f"# Contains 15-20 carefully selected songs.\n"
             )
-            playlist_file = music_folder / f"{name.replace(' ', '_')}.m3u"
-            playlist_file.write_text(simple_content, encoding='utf-8')
-            created_files.append(playlist_file)
+            writes.append((write_utf8, music_folder / f"{name.replace(' ', '_')}.m3u", simple_content))
 
         # Add a few fake MP3 files to make the folder feel populated
         sample_tracks = ["morning_run.mp3", "focus_beats.mp3", "weekend_chill.mp3"]
         for track in sample_tracks:
-            track_path = music_folder / track
             # Use stub bytes so file has size and correct extension
-            padded = SAMPLE_JPEG_BYTES + random.randbytes(random.randint(1500, 4000))
-            write_binary_file(track_path, padded)
-            created_files.append(track_path)
-        
-        print(f"    ✓ Generated music files")
+            padded = self._padded_sample(1500, 4000)
+            writes.append((Path.write_bytes, music_folder / track, padded))
         
         # Photos folder
-        photos_folder = personal_folder / "Photos"
-        ensure_directory(photos_folder)
-        
-        photo_catalog, entries = self.generate_photo_catalog(15)
-        catalog_file = photos_folder / "Photo_Catalog.txt"
-        catalog_file.write_text(photo_catalog, encoding='utf-8')
-        created_files.append(catalog_file)
-        created_files.extend(self.create_photo_files(photos_folder, entries))
         
-        print(f"    ✓ Generated photo catalog")
+        photo_catalog, entries = self.generate_photo_catalog(15, now)
+        writes.append((write_utf8, photos_folder / "Photo_Catalog.txt", photo_catalog))
+        writes.extend(self._photo_file_writes(photos_folder, entries))
         
         # Health folder
-        health_folder = personal_folder / "Health"
-        ensure_directory(health_folder)
         
         health_record = self.generate_health_records()
         health_file = health_folder / "Health_Records.pdf"
-        create_pdf(health_file, "Personal Health Records", [("Health", health_record)])
-        created_files.append(health_file)
-        
-        print(f"    ✓ Generated health records")
+        writes.append((create_pdf, health_file, "Personal Health Records", [("Health", health_record)]))
         
         # Receipts folder
-        receipts_folder = personal_folder / "Receipts"
-        ensure_directory(receipts_folder)
         
         for i in range(8):
-            receipt = self.generate_receipt()
-            date = datetime.now() - timedelta(days=random.randint(1, 90))
+            # Name the file after the purchase date printed on the receipt
+            receipt, date = self.generate_receipt(now)
             receipt_file = receipts_folder / f"Receipt_{date.strftime('%Y%m%d')}_{i+1}.pdf"
-            create_pdf(receipt_file, "Receipt", [("Receipt", receipt)])
-            created_files.append(receipt_file)
+            writes.append((create_pdf, receipt_file, "Receipt", [("Receipt", receipt)]))
+        
+        created_files = _run_writes(writes)
         
-        print(f"    ✓ Generated receipts")
+        print("\n".join([
+            "    ✓ Generated music files",
+            "    ✓ Generated photo catalog",
+            "    ✓ Generated health records",
+            "    ✓ Generated receipts",
+        ]))
         
         return created_files
@@ -4,7 +4,9 @@ Tax Document Generator
 Creates realistic federal and state tax returns for California
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from config import (
@@ -12,27 +14,107 @@ from config import (
     USER_STATE, USER_ZIP, TAX_YEARS, FEDERAL_TAX_BRACKETS,
     STATE_TAX_BRACKETS, USER_FIRST_NAME, USER_LAST_NAME
 )
-from utils.helpers import format_currency, ensure_directory, create_pdf
+from utils.helpers import format_currency, ensure_directory, render_pdf
 
 
-class TaxDocumentGenerator:
-    """Generates realistic tax documents"""
+# Config values substituted into the %-style templates below
+TEMPLATE_FIELDS = {
+    "user_name": USER_NAME,
+    "ssn": USER_SSN,
+    "address": USER_ADDRESS,
+    "city": USER_CITY,
+    "state": USER_STATE,
+    "zip": USER_ZIP,
+}
+
+# Employer details and the zero or fixed boxes are constant, so those
+# amounts are written out already formatted
+W2_FORM_TEMPLATE = """W-2 WAGE AND TAX STATEMENT
+Tax Year: %(year)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+EMPLOYER INFORMATION
+
+Employer: beingMalicious.com Inc.
+EIN: 94-1234567
+Address: 450 Market Street, Suite 1200
+City, State, ZIP: San Francisco, CA 94111
+
+═══════════════════════════════════════════════════════════════════════════
+
+EMPLOYEE INFORMATION
+
+Employee: %(user_name)s
+SSN: %(ssn)s
+Address: %(address)s
+City, State, ZIP: %(city)s, %(state)s %(zip)s
+
+═══════════════════════════════════════════════════════════════════════════
+
+WAGES AND WITHHOLDING
+
+Box 1  - Wages, tips, other compensation              %(income)s
+Box 2  - Federal income tax withheld                  %(federal_tax)s
+Box 3  - Social security wages                        %(income)s
+Box 4  - Social security tax withheld                 %(ss_tax)s
+Box 5  - Medicare wages and tips                      %(income)s
+Box 6  - Medicare tax withheld                        %(medicare_tax)s
+
+Box 12a - DD: $8,500.00  (Cost of employer-sponsored health coverage)
+
+Box 15 - State: CA
+Box 16 - State wages, tips, etc.                      %(income)s
+Box 17 - State income tax                             %(state_tax)s
+Box 18 - Local wages, tips, etc.                      $0.00
+Box 19 - Local income tax                             $0.00
+
+═══════════════════════════════════════════════════════════════════════════
+
+This is a copy of your W-2 wage statement for tax year %(year)s.
+Please retain for your records and use when filing your tax return.
+
+Issued: January 28, %(next_year)s
+
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+# Single-filer standard deductions by tax year; earlier years use the first
+# entry and later years the last (see _standard_deduction)
+FEDERAL_STANDARD_DEDUCTIONS = {2022: 12950, 2023: 13850, 2024: 14600}
+CA_STANDARD_DEDUCTIONS = {2022: 5202, 2023: 5363, 2024: 5552}
+
+
+def _standard_deduction(deductions, year):
+    """Deduction for year, clamped to the first and last years in the table"""
+    return deductions[min(max(year, min(deductions)), max(deductions))]
+
+
+@lru_cache(maxsize=None)
+def _federal_tax_return_text(year):
+    """Form 1040 text for a tax year; depends only on the year and config"""
+    tax_data = FEDERAL_TAX_BRACKETS[year]
     
-    def __init__(self, base_path):
-        self.base_path = Path(base_path)
+    # Calculate various tax components
+    income = tax_data["income"]
+    standard_deduction = _standard_deduction(FEDERAL_STANDARD_DEDUCTIONS, year)
+    taxable_income = income - standard_deduction
+    tax_paid = tax_data["tax_paid"]
+    refund = tax_data["refund"]
     
-    def generate_federal_tax_return(self, year):
-        """Generate Form 1040 (Federal Tax Return)"""
-        tax_data = FEDERAL_TAX_BRACKETS[year]
-        
-        # Calculate various tax components
-        income = tax_data["income"]
-        standard_deduction = 12950 if year <= 2022 else 13850 if year <= 2023 else 14600
-        taxable_income = income - standard_deduction
-        tax_paid = tax_data["tax_paid"]
-        refund = tax_data["refund"]
-        
-        content = f"""FORM 1040 - U.S. INDIVIDUAL INCOME TAX RETURN
+    if refund > 0:
+        refund_block = (
+            f"22. REFUND (Line 21 - Line 20)                          {format_currency(refund)}\n\n"
+            "    ☒ Direct deposit to checking account\n"
+            "    Routing Number: 121000248\n"
+            "    Account Number: ****5678\n"
+        )
+        processed_line = f"Refund issued: 05/10/{year + 1}"
+    else:
+        refund_block = f"22. AMOUNT YOU OWE (Line 20 - Line 21)                  {format_currency(abs(refund))}\n"
+        processed_line = f"Payment received: 04/15/{year + 1}"
+    
+    return f"""FORM 1040 - U.S. INDIVIDUAL INCOME TAX RETURN
 Tax Year: {year}
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -104,17 +186,7 @@ REFUND OR AMOUNT OWED
 20. Total Tax (Line 15)                                  {format_currency(tax_paid + refund)}
 21. Total Payments (Line 19)                             {format_currency(tax_paid)}
 
-"""
-        
-        if refund > 0:
-            content += f"22. REFUND (Line 21 - Line 20)                          {format_currency(refund)}\n\n"
-            content += "    ☒ Direct deposit to checking account\n"
-            content += "    Routing Number: 121000248\n"
-            content += "    Account Number: ****5678\n"
-        else:
-            content += f"22. AMOUNT YOU OWE (Line 20 - Line 21)                  {format_currency(abs(refund))}\n"
-        
-        content += f"""
+{refund_block}
 ═══════════════════════════════════════════════════════════════════════════
 
 SIGNATURE
@@ -130,25 +202,37 @@ Taxpayer's signature: {USER_NAME}                    Date: 04/12/{year + 1}
 For IRS Use Only
 
 Return processed: 04/28/{year + 1}
-{"Refund issued: 05/10/" + str(year + 1) if refund > 0 else "Payment received: 04/15/" + str(year + 1)}
+{processed_line}
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
+
+
+@lru_cache(maxsize=None)
+def _state_tax_return_text(year):
+    """California Form 540 text for a tax year; depends only on the year and config"""
+    state_data = STATE_TAX_BRACKETS[year]
+    federal_data = FEDERAL_TAX_BRACKETS[year]
     
-    def generate_state_tax_return(self, year):
-        """Generate California State Tax Return (Form 540)"""
-        state_data = STATE_TAX_BRACKETS[year]
-        federal_data = FEDERAL_TAX_BRACKETS[year]
-        
-        income = state_data["income"]
-        state_standard_deduction = 5202 if year <= 2022 else 5363 if year <= 2023 else 5552
-        taxable_income = income - state_standard_deduction
-        tax_paid = state_data["tax_paid"]
-        refund = state_data["refund"]
-        
-        content = f"""FORM 540 - CALIFORNIA RESIDENT INCOME TAX RETURN
+    income = state_data["income"]
+    state_standard_deduction = _standard_deduction(CA_STANDARD_DEDUCTIONS, year)
+    taxable_income = income - state_standard_deduction
+    tax_paid = state_data["tax_paid"]
+    refund = state_data["refund"]
+    
+    if refund > 0:
+        refund_block = (
+            f"18. REFUND (Payments - Total Tax)                       {format_currency(refund)}\n\n"
+            "    Direct deposit information:\n"
+            "    ☒ Checking  ☐ Savings\n"
+            "    Routing: 121000248  Account: ****5678\n"
+        )
+        processed_line = f"Refund issued: 05/15/{year + 1}"
+    else:
+        refund_block = f"18. AMOUNT YOU OWE                                       {format_currency(abs(refund))}\n"
+        processed_line = f"Payment due: 04/15/{year + 1}"
+    
+    return f"""FORM 540 - CALIFORNIA RESIDENT INCOME TAX RETURN
 Tax Year: {year}
 
 ═══════════════════════════════════════════════════════════════════════════
@@ -209,17 +293,7 @@ PAYMENTS
 
 REFUND OR AMOUNT OWED
 
-"""
-        
-        if refund > 0:
-            content += f"18. REFUND (Payments - Total Tax)                       {format_currency(refund)}\n\n"
-            content += "    Direct deposit information:\n"
-            content += "    ☒ Checking  ☐ Savings\n"
-            content += "    Routing: 121000248  Account: ****5678\n"
-        else:
-            content += f"18. AMOUNT YOU OWE                                       {format_currency(abs(refund))}\n"
-        
-        content += f"""
+{refund_block}
 ═══════════════════════════════════════════════════════════════════════════
 
 SIGNATURE AND DECLARATION
@@ -235,108 +309,121 @@ Your signature: {USER_NAME}                         Date: 04/12/{year + 1}
 FRANCHISE TAX BOARD USE ONLY
 
 Processed: 05/02/{year + 1}
-{"Refund issued: 05/15/" + str(year + 1) if refund > 0 else "Payment due: 04/15/" + str(year + 1)}
+{processed_line}
 
 California Franchise Tax Board
 Sacramento, CA 95827
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-        
-        return content
-    
-    def generate_w2_form(self, year):
-        """Generate W-2 Wage and Tax Statement"""
-        income = FEDERAL_TAX_BRACKETS[year]["income"]
-        federal_tax = FEDERAL_TAX_BRACKETS[year]["tax_paid"]
-        state_tax = STATE_TAX_BRACKETS[year]["tax_paid"]
-        
-        ss_tax = round(income * 0.062, 2)
-        medicare_tax = round(income * 0.0145, 2)
-        
-        content = f"""W-2 WAGE AND TAX STATEMENT
-Tax Year: {year}
-
-═══════════════════════════════════════════════════════════════════════════
 
-EMPLOYER INFORMATION
-
-Employer: beingMalicious.com Inc.
-EIN: 94-1234567
-Address: 450 Market Street, Suite 1200
-City, State, ZIP: San Francisco, CA 94111
-
-═══════════════════════════════════════════════════════════════════════════
 
-EMPLOYEE INFORMATION
-
-Employee: {USER_NAME}
-SSN: {USER_SSN}
-Address: {USER_ADDRESS}
-City, State, ZIP: {USER_CITY}, {USER_STATE} {USER_ZIP}
-
-═══════════════════════════════════════════════════════════════════════════
-
-WAGES AND WITHHOLDING
+@lru_cache(maxsize=None)
+def _w2_form_text(year):
+    """W-2 text for a tax year; depends only on the year and config"""
+    income = FEDERAL_TAX_BRACKETS[year]["income"]
+    federal_tax = FEDERAL_TAX_BRACKETS[year]["tax_paid"]
+    state_tax = STATE_TAX_BRACKETS[year]["tax_paid"]
+    
+    ss_tax = round(income * 0.062, 2)
+    medicare_tax = round(income * 0.0145, 2)
+    
+    return W2_FORM_TEMPLATE % dict(
+        TEMPLATE_FIELDS,
+        year=year,
+        next_year=year + 1,
+        income=format_currency(income),
+        federal_tax=format_currency(federal_tax),
+        ss_tax=format_currency(ss_tax),
+        medicare_tax=format_currency(medicare_tax),
+        state_tax=format_currency(state_tax),
+    )
 
-Box 1  - Wages, tips, other compensation              {format_currency(income)}
-Box 2  - Federal income tax withheld                  {format_currency(federal_tax)}
-Box 3  - Social security wages                        {format_currency(income)}
-Box 4  - Social security tax withheld                 {format_currency(ss_tax)}
-Box 5  - Medicare wages and tips                      {format_currency(income)}
-Box 6  - Medicare tax withheld                        {format_currency(medicare_tax)}
 
-Box 12a - DD: {format_currency(8500)}  (Cost of employer-sponsored health coverage)
+@lru_cache(maxsize=None)
+def _form_pdf_bytes(title, heading, content):
+    """
+    Rendered PDF for one form. The form text is itself cached per year, so
+    repeated runs in one process skip the fpdf2 layout pass entirely.
+    """
+    return render_pdf(title, [(heading, content)])
 
-Box 15 - State: CA
-Box 16 - State wages, tips, etc.                      {format_currency(income)}
-Box 17 - State income tax                             {format_currency(state_tax)}
-Box 18 - Local wages, tips, etc.                      {format_currency(0)}
-Box 19 - Local income tax                             {format_currency(0)}
 
-═══════════════════════════════════════════════════════════════════════════
+def _write_form_pdf(path, title, heading, content):
+    """Write one tax form PDF"""
+    Path(path).write_bytes(_form_pdf_bytes(title, heading, content))
 
-This is a copy of your W-2 wage statement for tax year {year}.
-Please retain for your records and use when filing your tax return.
-
-Issued: January 28, {year + 1}
 
-═══════════════════════════════════════════════════════════════════════════
-"""
+class TaxDocumentGenerator:
+    """Generates realistic tax documents"""
+    
+    def __init__(self, base_path):
+        self.base_path = Path(base_path)
+    
+    def generate_federal_tax_return(self, year):
+        """Generate Form 1040 (Federal Tax Return)"""
+        return _federal_tax_return_text(year)
+    
+    def generate_state_tax_return(self, year):
+        """Generate California State Tax Return (Form 540)"""
+        return _state_tax_return_text(year)
+    
+    def generate_w2_form(self, year):
+        """Generate W-2 Wage and Tax Statement"""
+        return _w2_form_text(year)
+    
+    def _generate_year_documents(self, tax_folder, year):
+        """Write one year's 1040, 540 and W-2; returns their paths"""
+        year_folder = tax_folder / str(year)
+        ensure_directory(year_folder)
+        
+        # Federal return
+        federal_content = self.generate_federal_tax_return(year)
+        federal_file = year_folder / f"Form_1040_Federal_{year}.pdf"
+        _write_form_pdf(federal_file, f"Form 1040 Federal {year}", "Return", federal_content)
+        
+        # State return
+        state_content = self.generate_state_tax_return(year)
+        state_file = year_folder / f"Form_540_California_{year}.pdf"
+        _write_form_pdf(state_file, f"Form 540 California {year}", "Return", state_content)
+        
+        # W-2
+        w2_content = self.generate_w2_form(year)
+        w2_file = year_folder / f"W2_Form_{year}.pdf"
+        _write_form_pdf(w2_file, f"W-2 {year}", "W-2", w2_content)
         
-        return content
+        return [federal_file, state_file, w2_file]
     
-    def generate_all_tax_documents(self):
-        """Generate all tax documents for specified years"""
+    def write_all_tax_documents(self):
+        """
+        Write every year's documents without printing.
+        Returns (created files, progress lines) so callers running this in
+        the background can report it once it finishes.
+        """
         created_files = []
         
-        print("\n[*] Generating tax documents...")
-        
+        # Year folders are created with their parents, so tax_folder itself
+        # needs no separate mkdir
         tax_folder = self.base_path / "Desktop" / "Tax Documents"
-        ensure_directory(tax_folder)
         
-        for year in TAX_YEARS:
-            year_folder = tax_folder / str(year)
-            ensure_directory(year_folder)
-            
-            # Federal return
-            federal_content = self.generate_federal_tax_return(year)
-            federal_file = year_folder / f"Form_1040_Federal_{year}.pdf"
-            create_pdf(federal_file, f"Form 1040 Federal {year}", [("Return", federal_content)])
-            created_files.append(federal_file)
-            
-            # State return
-            state_content = self.generate_state_tax_return(year)
-            state_file = year_folder / f"Form_540_California_{year}.pdf"
-            create_pdf(state_file, f"Form 540 California {year}", [("Return", state_content)])
-            created_files.append(state_file)
-            
-            # W-2
-            w2_content = self.generate_w2_form(year)
-            w2_file = year_folder / f"W2_Form_{year}.pdf"
-            create_pdf(w2_file, f"W-2 {year}", [("W-2", w2_content)])
-            created_files.append(w2_file)
-            
-            print(f"    ✓ Generated tax documents for {year}")
+        # Years are independent and draw no random numbers, so build them
+        # concurrently; results and progress lines stay in TAX_YEARS order
+        with ThreadPoolExecutor(max_workers=len(TAX_YEARS)) as pool:
+            year_files = list(pool.map(
+                self._generate_year_documents, [tax_folder] * len(TAX_YEARS), TAX_YEARS
+            ))
+        
+        for files in year_files:
+            created_files.extend(files)
+        log_lines = [f"    ✓ Generated tax documents for {year}" for year in TAX_YEARS]
+        
+        return created_files, log_lines
+    
+    def generate_all_tax_documents(self):
+        """Generate all tax documents for specified years"""
+        print("\n[*] Generating tax documents...")
+        
+        created_files, log_lines = self.write_all_tax_documents()
+        print("\n".join(log_lines))
         
         return created_files
@@ -19,7 +19,9 @@ Version: 2.0
 Last Updated: December 2024
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -40,6 +42,33 @@ from generators.enhanced_documents import EnhancedDocumentGenerator
 from utils.helpers import ensure_directory, get_windows_paths
 
 
+# Closing banner printed after a successful run, joined into one write
+SUCCESS_SUMMARY = "\n".join([
+    "\n📊 SUMMARY BY CATEGORY:",
+    "  • Browser Data (Chrome, Firefox, Edge)",
+    "  • Tax Documents (Federal & State, 2022-2025)",
+    "  • Investment Statements (Stocks, Bonds, ETFs)",
+    "  • Office Documents (Reports, Presentations)",
+    "  • Personal Files (Music, Photos, Health)",
+    "  • Credentials (Git, SSH, AWS, Docker, NPM)",
+    "  • Application Data & Licenses",
+    "  • Employment Documents & Reviews",
+    "\n🎯 KEY FEATURES:",
+    "  ✓ Realistic browsing history for 3 browsers",
+    "  ✓ Saved passwords for 15+ websites",
+    "  ✓ Complete tax returns with SSN",
+    "  ✓ Investment portfolio with real stock symbols",
+    "  ✓ Professional work documents",
+    "  ✓ Personal music, photos, and health records",
+    "  ✓ Git and development environment configs",
+    "  ✓ Software licenses and installation data",
+    "\n" + "="*80,
+    "Your sandbox environment is now populated with realistic data!",
+    "All content is FAKE and designed for malware analysis purposes.",
+    "="*80 + "\n",
+])
+
+
 class SandboxPopulator:
     """Main class that orchestrates the sandbox population process"""
     
@@ -54,6 +83,7 @@ class SandboxPopulator:
         self.base_path = self.paths["home"]
         
         self.created_files = []
+        self.created_dirs = set()
         
         # Initialize all generators
         self.browser_gen = BrowserDataGenerator(self.base_path, self.paths)
@@ -82,9 +112,15 @@ class SandboxPopulator:
             self.paths["program_files"],
         ]
         
+        # Progress lines are printed in one call
         for folder_path in base_folders:
             ensure_directory(folder_path)
-            print(f"    ✓ {folder_path}")
+        print("\n".join(f"    ✓ {folder_path}" for folder_path in base_folders))
+    
+    def _add_created_files(self, files):
+        """Record generated files and the directories they were written to"""
+        self.created_files.extend(files)
+        self.created_dirs.update(f.parent for f in files)
     
     def populate_all(self):
         """
@@ -105,67 +141,54 @@ class SandboxPopulator:
             # Step 1: Create base structure
             self.create_base_directory_structure()
             
-            # Step 2: Tax documents
-            files = self.tax_gen.generate_all_tax_documents()
-            self.created_files.extend(files)
-            
-            # Step 3: Investment documents
-            files = self.investment_gen.generate_all_investment_documents()
-            self.created_files.extend(files)
-            
-            # Step 4: Office documents
-            files = self.office_gen.generate_all_office_documents()
-            self.created_files.extend(files)
-            
-            # Step 5: Personal folders
-            files = self.personal_gen.generate_all_personal_folders()
-            self.created_files.extend(files)
-            
-            # Step 6: Credentials
-            files = self.creds_gen.generate_all_credentials()
-            self.created_files.extend(files)
-            
-            # Step 7: Application data
-            files = self.app_gen.generate_all_application_data()
-            self.created_files.extend(files)
-            
-            # Step 8: Enhanced documents
-            files = self.enhanced_gen.generate_all_enhanced_documents()
-            self.created_files.extend(files)
+            # Step 2: Tax documents. These draw no random numbers and are
+            # mostly PDF layout, so they are built in the background while
+            # the remaining generators run in order on this thread, which
+            # keeps the draw order stable for callers who seed random
+            print("\n[*] Generating tax documents in the background...")
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                tax_future = pool.submit(self.tax_gen.write_all_tax_documents)
+                
+                # Step 3: Investment documents
+                files = self.investment_gen.generate_all_investment_documents()
+                self._add_created_files(files)
+                
+                # Step 4: Office documents
+                files = self.office_gen.generate_all_office_documents()
+                self._add_created_files(files)
+                
+                # Step 5: Personal folders
+                files = self.personal_gen.generate_all_personal_folders()
+                self._add_created_files(files)
+                
+                # Step 6: Credentials
+                files = self.creds_gen.generate_all_credentials()
+                self._add_created_files(files)
+                
+                # Step 7: Application data
+                files = self.app_gen.generate_all_application_data()
+                self._add_created_files(files)
+                
+                # Step 8: Enhanced documents
+                files = self.enhanced_gen.generate_all_enhanced_documents()
+                self._add_created_files(files)
 
-            # Step 9: Browser data (history, credentials, cookies) last to avoid conflicts
-            files = self.browser_gen.generate_all_browser_data()
-            self.created_files.extend(files)
-            
-            # Success summary
-            print("\n" + "="*80)
-            print(f"\n[✓] SUCCESS! Created {len(self.created_files)} files")
-            print("="*80)
+                # Step 9: Browser data (history, credentials, cookies) last to avoid conflicts
+                files = self.browser_gen.generate_all_browser_data()
+                self._add_created_files(files)
+                
+                tax_files, tax_log = tax_future.result()
             
-            print("\n📊 SUMMARY BY CATEGORY:")
-            print("  • Browser Data (Chrome, Firefox, Edge)")
-            print("  • Tax Documents (Federal & State, 2022-2025)")
-            print("  • Investment Statements (Stocks, Bonds, ETFs)")
-            print("  • Office Documents (Reports, Presentations)")
-            print("  • Personal Files (Music, Photos, Health)")
-            print("  • Credentials (Git, SSH, AWS, Docker, NPM)")
-            print("  • Application Data & Licenses")
-            print("  • Employment Documents & Reviews")
+            # The background step finishes last, so its files and progress
+            # lines are recorded after the other generators
+            self._add_created_files(tax_files)
+            print("\n[*] Tax documents finished (background step)")
+            print("\n".join(tax_log))
             
-            print("\n🎯 KEY FEATURES:")
-            print("  ✓ Realistic browsing history for 3 browsers")
-            print("  ✓ Saved passwords for 15+ websites")
-            print("  ✓ Complete tax returns with SSN")
-            print("  ✓ Investment portfolio with real stock symbols")
-            print("  ✓ Professional work documents")
-            print("  ✓ Personal music, photos, and health records")
-            print("  ✓ Git and development environment configs")
-            print("  ✓ Software licenses and installation data")
+            # Success summary
+            print(f"\n{'='*80}\n\n[✓] SUCCESS! Created {len(self.created_files)} files\n{'='*80}")
             
-            print("\n" + "="*80)
-            print("Your sandbox environment is now populated with realistic data!")
-            print("All content is FAKE and designed for malware analysis purposes.")
-            print("="*80 + "\n")
+            print(SUCCESS_SUMMARY)
             
             return True
             
@@ -175,13 +198,22 @@ class SandboxPopulator:
             traceback.print_exc()
             return False
     
+    @staticmethod
+    def _file_size(path):
+        """Size of a created file, or 0 if it has since disappeared"""
+        # A single stat per file, rather than exists() followed by stat()
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+    
     def get_statistics(self):
         """Get statistics about created files"""
         
         stats = {
             "total_files": len(self.created_files),
-            "total_size_bytes": sum(f.stat().st_size for f in self.created_files if f.exists()),
-            "directories": set(f.parent for f in self.created_files)
+            "total_size_bytes": sum(self._file_size(f) for f in self.created_files),
+            "directories": self.created_dirs
         }
         
         return stats
@@ -273,10 +305,12 @@ if __name__ == "__main__":
         if success:
             # Print statistics
             stats = populator.get_statistics()
-            print(f"\n📈 STATISTICS:")
-            print(f"  Total Files Created: {stats['total_files']}")
-            print(f"  Total Size: {stats['total_size_bytes'] / (1024*1024):.2f} MB")
-            print(f"  Directories Used: {len(stats['directories'])}")
+            print(
+                "\n📈 STATISTICS:\n"
+                f"  Total Files Created: {stats['total_files']}\n"
+                f"  Total Size: {stats['total_size_bytes'] / (1024*1024):.2f} MB\n"
+                f"  Directories Used: {len(stats['directories'])}"
+            )
             
             sys.exit(0)
         else:
@@ -3,9 +3,14 @@
 Helper utilities for file creation and manipulation
 """
 
+import copy
+import functools
+import io
 import os
 import random
 import string
+import textwrap
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -16,12 +21,20 @@ def ensure_directory(path):
     return path
 
 
+# Alphabets for random_string, built once rather than on every call
+RANDOM_STRING_CHARS = string.ascii_letters + string.digits
+RANDOM_STRING_CHARS_SPECIAL = RANDOM_STRING_CHARS + "!@#$%^&*()"
+
+
 def random_string(length=10, include_special=False):
     """Generate a random string"""
-    chars = string.ascii_letters + string.digits
-    if include_special:
-        chars += "!@#$%^&*()"
-    return ''.join(random.choice(chars) for _ in range(length))
+    chars = RANDOM_STRING_CHARS_SPECIAL if include_special else RANDOM_STRING_CHARS
+    return ''.join(random.choices(chars, k=length))
+
+
+def random_ints(low, high, count):
+    """Draw `count` random integers in [low, high] with a single call"""
+    return random.choices(range(low, high + 1), k=count)
 
 
 def random_date(start_date, end_date):
@@ -39,18 +52,18 @@ def format_currency(amount):
 
 def generate_fake_ssn():
     """Generate a fake SSN (for sandbox use only)"""
-    area = random.randint(100, 899)
-    group = random.randint(10, 99)
-    serial = random.randint(1000, 9999)
-    return f"{area}-{group}-{serial}"
+    # One draw decoded into area (100-899), group (10-99), serial (1000-9999)
+    n, serial = divmod(random.randrange(800 * 90 * 9000), 9000)
+    area, group = divmod(n, 90)
+    return f"{area + 100}-{group + 10}-{serial + 1000}"
 
 
 def generate_fake_phone():
     """Generate a fake phone number"""
-    area = random.randint(200, 999)
-    prefix = random.randint(200, 999)
-    line = random.randint(1000, 9999)
-    return f"({area}) {prefix}-{line}"
+    # One draw decoded into area and prefix (200-999) and line (1000-9999)
+    n, line = divmod(random.randrange(800 * 800 * 9000), 9000)
+    area, prefix = divmod(n, 800)
+    return f"({area + 200}) {prefix + 200}-{line + 1000}"
 
 
 def generate_fake_email(name, domain="example.com"):
@@ -61,26 +74,38 @@ def generate_fake_email(name, domain="example.com"):
 
 def random_ip_address():
     """Generate a random IP address"""
-    return f"{random.randint(1, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 255)}"
+    # First and last octets are 1-255, middle octets 0-255; one draw is
+    # decoded into all four so the distribution stays uniform
+    n, last = divmod(random.randrange(255 * 256 * 256 * 255), 255)
+    n, third = divmod(n, 256)
+    first, second = divmod(n, 256)
+    return f"{first + 1}.{second}.{third}.{last + 1}"
 
 
 def random_mac_address():
     """Generate a random MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    return random.getrandbits(48).to_bytes(6, 'big').hex(':')
+
+
+FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def file_size_string(size_bytes):
     """Convert bytes to human-readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Each unit spans 10 bits; integer thresholds survive int() truncation,
+    # so float sizes pick the same unit
+    exponent = min((int(size_bytes).bit_length() - 1) // 10, len(FILE_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {FILE_SIZE_UNITS[exponent]}"
 
 
 def generate_guid():
     """Generate a GUID-like string"""
-    return f"{random_string(8)}-{random_string(4)}-{random_string(4)}-{random_string(4)}-{random_string(12)}"
+    # One 32-character draw consumes the same random stream as the five
+    # separate segment draws, so seeded output is unchanged
+    chars = random_string(32)
+    return f"{chars[:8]}-{chars[8:12]}-{chars[12:16]}-{chars[16:20]}-{chars[20:]}"
 
 
 def weighted_random_choice(choices, weights):
@@ -110,6 +135,17 @@ def write_text_file(path, content, encoding='utf-8'):
     return file_path
 
 
+def write_utf8(path, text):
+    """
+    Write text as pre-encoded UTF-8 bytes, skipping the TextIOWrapper layer.
+    Newlines are translated to the platform's, as text mode would.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    Path(path).write_bytes(text.encode("utf-8"))
+    return path
+
+
 def write_binary_file(path, data: bytes):
     """
     Write binary data to a file and ensure its parent directory exists.
@@ -121,13 +157,15 @@ def write_binary_file(path, data: bytes):
     return file_path
 
 
+CHROME_EPOCH = datetime(1601, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
 def chrome_timestamp(dt: datetime) -> int:
     """
     Convert a datetime to Chrome/Webkit timestamp (microseconds since Jan 1, 1601 UTC).
     """
-    epoch_start = datetime(1601, 1, 1)
-    delta = dt - epoch_start
-    return int(delta.total_seconds() * 1_000_000)
+    return (dt - CHROME_EPOCH) // ONE_MICROSECOND
 
 
 def firefox_timestamp(dt: datetime) -> int:
@@ -137,41 +175,50 @@ def firefox_timestamp(dt: datetime) -> int:
     return int(dt.timestamp() * 1_000_000)
 
 
-def create_pdf(path, title, sections):
+# Character width used to pre-wrap PDF body lines before multi_cell
+PDF_WRAP_WIDTH = 90
+_pdf_line_wrapper = textwrap.TextWrapper(width=PDF_WRAP_WIDTH)
+
+
+def _safe(text: str) -> str:
+    # Replace characters that can't be represented to avoid PDF errors;
+    # ASCII text, the common case, is already safe
+    if text.isascii():
+        return text
+    return text.encode("latin-1", "replace").decode("latin-1")
+
+
+def _emit_wrapped_lines(pdf_obj, text, avail_width):
     """
-    Create a simple multi-section PDF using fpdf2.
+    Write text to the PDF with manual wrapping to avoid long unbroken lines.
+    """
+    text = _safe(text)
+    width = PDF_WRAP_WIDTH
+    # If the line has no spaces, chunk it manually
+    if " " not in text and len(text) > width:
+        chunks = [text[i:i + width] for i in range(0, len(text), width)]
+    else:
+        chunks = _pdf_line_wrapper.wrap(text) or [text]
+
+    # avail_width is at least 20mm, wider than any single glyph at the body
+    # font size, so multi_cell can always break the chunk itself
+    for chunk in chunks:
+        pdf_obj.multi_cell(avail_width, 6, chunk)
+
+
+def render_pdf(title, sections):
+    """
+    Render a simple multi-section PDF using fpdf2 and return its bytes.
     sections: iterable of (heading, body_text)
     """
     from fpdf import FPDF
-    import textwrap
-
-    def _safe(text: str) -> str:
-        # Replace characters that can't be represented to avoid PDF errors
-        return text.encode("latin-1", "replace").decode("latin-1")
-
-    def _emit_wrapped_lines(pdf_obj, text, width=90):
-        """
-        Write text to the PDF with manual wrapping to avoid long unbroken lines.
-        """
-        text = _safe(text)
-        # If the line has no spaces, chunk it manually
-        if " " not in text and len(text) > width:
-            chunks = [text[i:i + width] for i in range(0, len(text), width)]
-        else:
-            chunks = textwrap.wrap(text, width=width) or [text]
-
-        # Use explicit width to avoid zero-width errors from FPDF
-        avail_width = max(int(pdf_obj.w - pdf_obj.l_margin - pdf_obj.r_margin), 20)
-        for chunk in chunks:
-            try:
-                pdf_obj.multi_cell(avail_width, 6, chunk)
-            except Exception:
-                # As a last resort, shrink further
-                pdf_obj.multi_cell(max(avail_width - 20, 20), 6, chunk)
 
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
+    # Use explicit width to avoid zero-width errors from FPDF; page
+    # geometry is fixed, so this is computed once per document
+    avail_width = max(int(pdf.w - pdf.l_margin - pdf.r_margin), 20)
     pdf.set_font("Arial", "B", 16)
     pdf.cell(0, 10, _safe(title), ln=1)
     pdf.ln(4)
@@ -181,11 +228,19 @@ def create_pdf(path, title, sections):
         pdf.cell(0, 8, _safe(heading), ln=1)
         pdf.set_font("Arial", "", 10)
         for line in body.splitlines():
-            _emit_wrapped_lines(pdf, line, width=90)
+            _emit_wrapped_lines(pdf, line, avail_width)
         pdf.ln(2)
 
-    pdf.output(str(path))
-    return Path(path)
+    return bytes(pdf.output())
+
+
+def create_pdf(path, title, sections):
+    """
+    Create a simple multi-section PDF using fpdf2.
+    sections: iterable of (heading, body_text)
+    """
+    # Render in memory and write the finished document in one call
+    return write_binary_file(path, render_pdf(title, sections))
 
 
 def create_workbook(path, sheets):
@@ -202,8 +257,27 @@ def create_workbook(path, sheets):
         ws = wb.create_sheet(sheet_name[:31] or "Sheet")
         for row in rows:
             ws.append(row)
-    wb.save(path)
-    return Path(path)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return write_binary_file(path, buffer.getvalue())
+
+
+@functools.lru_cache(maxsize=None)
+def _blank_presentation():
+    """Default python-pptx presentation, loaded from its bundled template once"""
+    from pptx import Presentation
+
+    return Presentation()
+
+
+# Guards the shared blank presentation while it is being copied
+_blank_presentation_lock = threading.Lock()
+
+
+def _new_presentation():
+    """Fresh empty presentation, deep-copied from the cached blank one"""
+    with _blank_presentation_lock:
+        return copy.deepcopy(_blank_presentation())
 
 
 def create_presentation(path, slides):
@@ -211,10 +285,9 @@ def create_presentation(path, slides):
     Create a PPTX presentation using python-pptx.
     slides: list of dicts {title: str, bullets: [str]}
     """
-    from pptx import Presentation
     from pptx.util import Inches, Pt
 
-    prs = Presentation()
+    prs = _new_presentation()
     for slide in slides:
         layout = prs.slide_layouts[1]  # Title and content
         s = prs.slides.add_slide(layout)
@@ -230,8 +303,9 @@ def create_presentation(path, slides):
                 p = tf.add_paragraph()
                 p.text = bullet
                 p.level = 1
-    prs.save(path)
-    return Path(path)
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return write_binary_file(path, buffer.getvalue())
 
 
 def get_windows_paths(base_override: str | Path | None = None):